@@ -6,7 +6,7 @@ import enum
 import typing
 
 
-class Direction(enum.Enum):
+class Direction(enum.IntEnum):
     """Cardinal directions for tile swapping."""
 
     LEFT = 0
@@ -17,9 +17,13 @@ class Direction(enum.Enum):
     @property
     def unit_vector(self) -> typing.Tuple[int, int]:
         """Returns (row_delta, column_delta) for this direction."""
-        return {
-            Direction.LEFT: (0, -1),
-            Direction.RIGHT: (0, 1),
-            Direction.UP: (-1, 0),
-            Direction.DOWN: (1, 0),
-        }[self]
+        return UNIT_VECTORS[self]
+
+
+# (row_delta, column_delta) for each Direction, indexed by its value.
+UNIT_VECTORS: typing.Tuple[typing.Tuple[int, int], ...] = (
+    (0, -1),
+    (0, 1),
+    (-1, 0),
+    (1, 0),
+)
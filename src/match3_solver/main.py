@@ -13,9 +13,8 @@ def main() -> None:
     puzzle_timer = timer_module.Timer()
 
     filename, output_path = utils.parse_arguments()
-    game_params = utils.parse_game_parameters(
-        utils.get_file_contents(filename)
-    )
+    file_contents = utils.get_file_contents(filename)
+    game_params = utils.parse_game_parameters(file_contents)
     game = utils.create_game_from_params(game_params)
 
     puzzle_solver = solver.Solver(game)
@@ -35,6 +34,7 @@ def main() -> None:
             puzzle_timer.elapsed_seconds,
             solution,
             game,
+            file_contents=file_contents,
         )
 
 
@@ -6,13 +6,44 @@ match detection, and state transitions.
 
 from __future__ import annotations
 
-import copy
+import functools
 import typing
 
 import action as action_module
 import direction as direction_module
 import state as state_module
 
+# Each adjacent pair is reached once by swapping up or left.
+_SWAP_DIRECTIONS = (
+    direction_module.Direction.UP,
+    direction_module.Direction.LEFT,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _pool_fill_table(
+    column_max: int, number_of_device_types: int
+) -> typing.Tuple[typing.Tuple[typing.Tuple[int, ...], ...], ...]:
+    """Precomputes the tile dropped into the pool after a match.
+
+    Args:
+        column_max: Pool width.
+        number_of_device_types: Total tile type count.
+
+    Returns:
+        Table indexed as [column][top pool tile][replace count % types].
+    """
+    return tuple(
+        tuple(
+            tuple(
+                (tile + column + count) % number_of_device_types + 1
+                for count in range(number_of_device_types)
+            )
+            for tile in range(number_of_device_types + 1)
+        )
+        for column in range(column_max)
+    )
+
 
 class Match3Game:
     """A match-3 puzzle game instance."""
@@ -59,6 +90,11 @@ class Match3Game:
         self.pool = pool
         self.grid = grid
 
+        # Dimensions are fixed for the whole game, so they are validated
+        # once here instead of on every grid operation.
+        Match3Game.grid_size(grid)
+        Match3Game.pool_size(pool)
+
     @staticmethod
     def grid_size(
         grid: typing.List[typing.List[int]],
@@ -125,33 +161,117 @@ class Match3Game:
     @staticmethod
     def actions(
         state: state_module.State,
-    ) -> typing.Union[
-        typing.List[action_module.Action],
-        typing.Generator[action_module.Action, None, None],
-    ]:
+    ) -> typing.List[action_module.Action]:
         """Generates all valid actions that produce a match.
 
         Args:
             state: Current game state.
 
         Returns:
-            Generator of valid Action objects, or empty list if no swaps left.
+            List of valid Action objects, empty if no swaps are left.
         """
-        row_max, column_max = Match3Game.grid_size(state.grid)
-
         if state.swaps >= state.max_swaps:
             return []
 
-        return (
+        return [
             action_module.Action((row, column), direction)
-            for row in range(0, row_max)
-            for column in range(0, column_max)
-            for direction in [
-                direction_module.Direction.UP,
-                direction_module.Direction.LEFT,
-            ]
-            if Match3Game.swap_is_valid(state.grid, (row, column), direction)
-        )
+            for row, column, direction in Match3Game.valid_swaps(state.grid)
+        ]
+
+    @staticmethod
+    def valid_swaps(
+        grid: typing.List[typing.List[int]],
+    ) -> typing.List[typing.Tuple[int, int, direction_module.Direction]]:
+        """Finds every swap that produces a match in a single grid pass.
+
+        A swap on a match-free grid can only create a match through one
+        of the two swapped tiles, so only the row and column runs through
+        those tiles are checked instead of rescanning the whole grid.
+
+        Args:
+            grid: The game grid (restored before returning).
+
+        Returns:
+            List of (row, column, direction) triples, in row-major order
+            with UP before LEFT for each tile.
+        """
+        row_max, column_max = len(grid), len(grid[0])
+        grid_has_match = Match3Game.match_exists(grid)
+        swaps: typing.List[
+            typing.Tuple[int, int, direction_module.Direction]
+        ] = []
+
+        for row in range(0, row_max):
+            for column in range(0, column_max):
+                for direction in _SWAP_DIRECTIONS:
+                    row_unit_vector, column_unit_vector = (
+                        direction_module.UNIT_VECTORS[direction]
+                    )
+                    other_row = row + row_unit_vector
+                    other_column = column + column_unit_vector
+                    if not (
+                        0 <= other_row < row_max
+                        and 0 <= other_column < column_max
+                    ):
+                        continue
+
+                    # The local check assumes a match-free grid; fall back
+                    # to a full rescan for unreduced starting boards.
+                    if grid_has_match:
+                        if Match3Game.swap_is_valid(
+                            grid, (row, column), direction
+                        ):
+                            swaps.append((row, column, direction))
+                        continue
+
+                    tile = grid[row][column]
+                    other_tile = grid[other_row][other_column]
+                    if tile == other_tile:
+                        continue
+
+                    grid[row][column] = other_tile
+                    grid[other_row][other_column] = tile
+                    is_valid = Match3Game._match_through(
+                        grid, row, column, row_max, column_max
+                    ) or Match3Game._match_through(
+                        grid, other_row, other_column, row_max, column_max
+                    )
+                    grid[row][column] = tile
+                    grid[other_row][other_column] = other_tile
+
+                    if is_valid:
+                        swaps.append((row, column, direction))
+
+        return swaps
+
+    @staticmethod
+    def _match_through(
+        grid: typing.List[typing.List[int]],
+        row: int,
+        column: int,
+        row_max: int,
+        column_max: int,
+    ) -> bool:
+        """Checks if the tile at (row, column) is part of a match of 3+."""
+        tile = grid[row][column]
+        grid_row = grid[row]
+
+        left = column
+        while left > 0 and grid_row[left - 1] == tile:
+            left -= 1
+        right = column
+        while right < column_max - 1 and grid_row[right + 1] == tile:
+            right += 1
+        if right - left >= 2:
+            return True
+
+        top = row
+        while top > 0 and grid[top - 1][column] == tile:
+            top -= 1
+        bottom = row
+        while bottom < row_max - 1 and grid[bottom + 1][column] == tile:
+            bottom += 1
+        return bottom - top >= 2
 
     @staticmethod
     def result(
@@ -160,6 +280,8 @@ class Match3Game:
         """Applies an action and returns the resulting state.
 
         Performs the swap, then reduces the grid until no matches remain.
+        The new grid shares row lists with the parent grid; a row is only
+        copied once the swap or a cascade is about to write to it.
 
         Args:
             state: Current game state.
@@ -168,16 +290,28 @@ class Match3Game:
         Returns:
             New state after applying the action.
         """
-        new_grid = copy.deepcopy(state.grid)
-        new_pool = copy.deepcopy(state.pool)
+        new_grid = list(state.grid)
+        new_pool = [pool_row[:] for pool_row in state.pool]
         points = state.points
 
+        row = action.row_column_pair[0]
+        row_unit_vector = direction_module.UNIT_VECTORS[action.direction][0]
+        Match3Game._unshare_rows(
+            new_grid, state.grid, (row, row + row_unit_vector)
+        )
         Match3Game.swap(new_grid, action.row_column_pair, action.direction)
 
-        while Match3Game.match_exists(new_grid):
-            matches = Match3Game.find_all_points_of_matches(new_grid)
+        matches = Match3Game.find_all_points_of_matches(new_grid)
+        while matches:
             points += len(matches)
-            Match3Game.reduce(new_grid, new_pool, state.number_of_device_types)
+            # Percolation rewrites every row above the lowest match.
+            lowest_row = max(match_row for match_row, _ in matches)
+            Match3Game._unshare_rows(
+                new_grid, state.grid, range(lowest_row + 1)
+            )
+            matches = Match3Game.cascade_step(
+                new_grid, new_pool, state.number_of_device_types, matches
+            )
 
         return state_module.State(
             new_grid,
@@ -188,6 +322,23 @@ class Match3Game:
             state.number_of_device_types,
         )
 
+    @staticmethod
+    def _unshare_rows(
+        grid: typing.List[typing.List[int]],
+        parent_grid: typing.List[typing.List[int]],
+        rows: typing.Iterable[int],
+    ) -> None:
+        """Copies the given rows of grid that are still shared with parent.
+
+        Args:
+            grid: Grid about to be mutated (modified in place).
+            parent_grid: Grid whose row lists must not be modified.
+            rows: Row indices that are about to be written.
+        """
+        for row in rows:
+            if grid[row] is parent_grid[row]:
+                grid[row] = grid[row][:]
+
     @staticmethod
     def path_cost(
         state: state_module.State, action: action_module.Action
@@ -220,13 +371,15 @@ class Match3Game:
         Raises:
             ValueError: If swap would go out of bounds.
         """
-        as_unit_vector = direction.unit_vector
+        row_unit_vector, column_unit_vector = direction_module.UNIT_VECTORS[
+            direction
+        ]
 
         old_row, old_column = row_column_pair
-        new_row = old_row + as_unit_vector[0]
-        new_column = old_column + as_unit_vector[1]
+        new_row = old_row + row_unit_vector
+        new_column = old_column + column_unit_vector
 
-        row_max, column_max = Match3Game.grid_size(grid)
+        row_max, column_max = len(grid), len(grid[0])
 
         if not (0 <= new_row < row_max and 0 <= old_row < row_max):
             raise ValueError(
@@ -249,39 +402,35 @@ class Match3Game:
         grid: typing.List[typing.List[int]],
         pool: typing.List[typing.List[int]],
         number_of_device_types: int,
-    ) -> None:
+        matches: typing.Optional[typing.Set[typing.Tuple[int, int]]] = None,
+    ) -> typing.Set[int]:
         """Removes matches and drops new tiles from the pool.
 
         Args:
             grid: The game grid (mutated in place).
             pool: The tile pool (mutated in place).
             number_of_device_types: Total tile type count.
-        """
+            matches: Points of matches in grid, if the caller already
+                found them; otherwise the grid is scanned.
 
-        def pool_fill_function(
-            column: int,
-            column_device_type: int,
-            device_replace_count: int,
-            num_types: int,
-        ) -> int:
-            return (
-                column_device_type + column + device_replace_count + num_types
-            ) % num_types + 1
-
-        row_columns_of_matches = sorted(
-            list(Match3Game.find_all_points_of_matches(grid))
-        )
-        pool_row_max, _ = Match3Game.pool_size(pool)
+        Returns:
+            Columns whose tiles changed, for find_all_points_of_matches.
+        """
+        if matches is None:
+            matches = Match3Game.find_all_points_of_matches(grid)
+        row_columns_of_matches = sorted(matches)
+        pool_row_max = len(pool)
+        pool_fill = _pool_fill_table(len(pool[0]), number_of_device_types)
         device_replace_count = 0
 
         for row, column in row_columns_of_matches:
+            # The fill value only depends on the count modulo the type count.
             device_replace_count += 1
-            new_pool_device = pool_fill_function(
-                column,
-                pool[0][column],
-                device_replace_count,
-                number_of_device_types,
-            )
+            if device_replace_count == number_of_device_types:
+                device_replace_count = 0
+            new_pool_device = pool_fill[column][pool[0][column]][
+                device_replace_count
+            ]
 
             if row > 0:
                 Match3Game._percolate_down(grid, column, row + 1)
@@ -291,6 +440,34 @@ class Match3Game:
             Match3Game._percolate_down(pool, column, pool_row_max)
             pool[0][column] = new_pool_device
 
+        return {column for _, column in row_columns_of_matches}
+
+    @staticmethod
+    def cascade_step(
+        grid: typing.List[typing.List[int]],
+        pool: typing.List[typing.List[int]],
+        number_of_device_types: int,
+        matches: typing.Set[typing.Tuple[int, int]],
+    ) -> typing.Set[typing.Tuple[int, int]]:
+        """Clears one round of matches and finds the matches left behind.
+
+        Fuses reduce with the follow-up scan, which only has to revisit
+        the columns reduce rewrote.
+
+        Args:
+            grid: The game grid (mutated in place).
+            pool: The tile pool (mutated in place).
+            number_of_device_types: Total tile type count.
+            matches: Points of all matches currently in grid.
+
+        Returns:
+            Points of matches in the reduced grid; empty once it settles.
+        """
+        changed_columns = Match3Game.reduce(
+            grid, pool, number_of_device_types, matches
+        )
+        return Match3Game.find_all_points_of_matches(grid, changed_columns)
+
     @staticmethod
     def _percolate_down(
         pool_or_grid: typing.List[typing.List[int]],
@@ -299,22 +476,22 @@ class Match3Game:
     ) -> None:
         """Shifts tiles down in a column.
 
+        The tile in the last shifted row wraps around to row 0.
+
         Args:
             pool_or_grid: Grid or pool to modify.
             column_to_percolate: Column index.
             row_max_to_percolate: Number of rows to shift.
         """
-        sorted_rows = sorted(range(row_max_to_percolate), reverse=True)
-
-        for i in range(len(sorted_rows) - 1):
-            column = column_to_percolate
-            old_row = sorted_rows[i]
-            new_row = sorted_rows[i + 1]
+        column = column_to_percolate
+        last_row = row_max_to_percolate - 1
+        if last_row <= 0:
+            return
 
-            pool_or_grid[old_row][column], pool_or_grid[new_row][column] = (
-                pool_or_grid[new_row][column],
-                pool_or_grid[old_row][column],
-            )
+        wrapped = pool_or_grid[last_row][column]
+        for row in range(last_row, 0, -1):
+            pool_or_grid[row][column] = pool_or_grid[row - 1][column]
+        pool_or_grid[0][column] = wrapped
 
     @staticmethod
     def swap_is_valid(
@@ -333,8 +510,10 @@ class Match3Game:
             True if the swap produces at least one match.
         """
         row, column = row_column_pair
-        row_unit_vector, column_unit_vector = direction.unit_vector
-        row_max, column_max = Match3Game.grid_size(grid)
+        row_unit_vector, column_unit_vector = direction_module.UNIT_VECTORS[
+            direction
+        ]
+        row_max, column_max = len(grid), len(grid[0])
 
         if not (0 <= row + row_unit_vector < row_max):
             return False
@@ -357,7 +536,7 @@ class Match3Game:
         Returns:
             True if a match exists.
         """
-        row_max, column_max = Match3Game.grid_size(grid)
+        row_max, column_max = len(grid), len(grid[0])
 
         # Check horizontal matches
         for row in range(0, row_max):
@@ -382,53 +561,92 @@ class Match3Game:
     @staticmethod
     def find_all_points_of_matches(
         grid: typing.List[typing.List[int]],
+        changed_columns: typing.Optional[typing.Iterable[int]] = None,
     ) -> typing.Set[typing.Tuple[int, int]]:
         """Finds all grid positions that are part of a match.
 
         Args:
             grid: The game grid.
+            changed_columns: Columns returned by reduce() for a grid that
+                had no other matches. Columns reduce left untouched cannot
+                hold a new vertical match, so only these are scanned
+                vertically. Scans every column when omitted.
 
         Returns:
             Set of (row, column) tuples in matches.
         """
-        return Match3Game._find_all_horizontal_matches(
-            grid
-        ) | Match3Game._find_all_vertical_matches(grid)
+        intersecting_points = Match3Game._find_all_horizontal_matches(grid)
+        Match3Game._find_all_vertical_matches(
+            grid, intersecting_points, changed_columns
+        )
+        return intersecting_points
 
     @staticmethod
     def _find_all_horizontal_matches(
         grid: typing.List[typing.List[int]],
+        intersecting_points: typing.Optional[
+            typing.Set[typing.Tuple[int, int]]
+        ] = None,
     ) -> typing.Set[typing.Tuple[int, int]]:
-        """Finds all positions in horizontal matches."""
-        intersecting_points: typing.Set[typing.Tuple[int, int]] = set()
-        row_max, column_max = Match3Game.grid_size(grid)
+        """Finds all positions in horizontal matches.
 
+        Points are added to intersecting_points when given, so callers can
+        collect both scans into one set.
+        """
+        if intersecting_points is None:
+            intersecting_points = set()
+        row_max, column_max = len(grid), len(grid[0])
+
+        # Walk runs of equal tiles so each matched cell is added once
         for row in range(0, row_max):
-            last_two = (grid[row][0], grid[row][1])
-            for column in range(2, column_max):
-                current_element = grid[row][column]
-                if last_two[0] == last_two[1] == current_element:
-                    points = [(row, column - i) for i in range(3)]
-                    intersecting_points = intersecting_points.union(points)
-                last_two = (last_two[1], current_element)
+            grid_row = grid[row]
+            run_start = 0
+            for column in range(1, column_max + 1):
+                if (
+                    column == column_max
+                    or grid_row[column] != grid_row[run_start]
+                ):
+                    if column - run_start >= 3:
+                        intersecting_points.update(
+                            (row, run_column)
+                            for run_column in range(run_start, column)
+                        )
+                    run_start = column
 
         return intersecting_points
 
     @staticmethod
     def _find_all_vertical_matches(
         grid: typing.List[typing.List[int]],
+        intersecting_points: typing.Optional[
+            typing.Set[typing.Tuple[int, int]]
+        ] = None,
+        columns: typing.Optional[typing.Iterable[int]] = None,
     ) -> typing.Set[typing.Tuple[int, int]]:
-        """Finds all positions in vertical matches."""
-        intersecting_points: typing.Set[typing.Tuple[int, int]] = set()
-        row_max, column_max = Match3Game.grid_size(grid)
+        """Finds all positions in vertical matches.
 
-        for column in range(0, column_max):
-            last_two = (grid[0][column], grid[1][column])
-            for row in range(2, row_max):
-                current_element = grid[row][column]
-                if last_two[0] == last_two[1] == current_element:
-                    points = [(row - i, column) for i in range(3)]
-                    intersecting_points = intersecting_points.union(points)
-                last_two = (last_two[1], current_element)
+        Points are added to intersecting_points when given, so callers can
+        collect both scans into one set. Only the given columns are
+        scanned when columns is set.
+        """
+        if intersecting_points is None:
+            intersecting_points = set()
+        row_max, column_max = len(grid), len(grid[0])
+        if columns is None:
+            columns = range(0, column_max)
+
+        for column in columns:
+            run_start = 0
+            for row in range(1, row_max + 1):
+                if (
+                    row == row_max
+                    or grid[row][column] != grid[run_start][column]
+                ):
+                    if row - run_start >= 3:
+                        intersecting_points.update(
+                            (run_row, column)
+                            for run_row in range(run_start, row)
+                        )
+                    run_start = row
 
         return intersecting_points
@@ -11,6 +11,8 @@ import state as state_module
 class SearchNode:
     """A node in the search tree."""
 
+    __slots__ = ("state", "action", "parent", "path_cost")
+
     def __init__(
         self,
         state: state_module.State,
@@ -35,7 +37,12 @@ class SearchNode:
         """Check node equality."""
         if not isinstance(other, SearchNode):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return (
+            self.path_cost == other.path_cost
+            and self.state == other.state
+            and self.action == other.action
+            and self.parent == other.parent
+        )
 
     def __hash__(self) -> int:
         """Hash based on state and path cost."""
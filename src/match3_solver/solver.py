@@ -67,18 +67,19 @@ class Solver:
             return node
 
         frontier: queue.PriorityQueue = queue.PriorityQueue()
-        explored: set = set()
+        explored: typing.Set[int] = set()
 
         frontier.put((h_value, nodes_generated, node))
-        explored.add(node)
+        explored.add(hash(node.state))
 
         while not frontier.empty():
             _, _, node = frontier.get()
 
             for action in match3.Match3Game.actions(node.state):
                 child = self._child_node(node.state, node, action)
+                child_key = hash(child.state)
 
-                if child not in explored:
+                if child_key not in explored:
                     nodes_generated += 1
                     self._log_progress(child)
 
@@ -87,7 +88,7 @@ class Solver:
                     ):
                         return child
 
-                    explored.add(child)
+                    explored.add(child_key)
                     frontier.put((f(child), nodes_generated, child))
 
         return None
@@ -116,18 +117,19 @@ class Solver:
             return node
 
         frontier: queue.PriorityQueue = queue.PriorityQueue()
-        explored: set = set()
+        explored: typing.Set[int] = set()
 
         frontier.put((h_value, nodes_generated, node))
-        explored.add(node)
+        explored.add(hash(node.state))
 
         while not frontier.empty():
             _, _, node = frontier.get()
 
             for action in match3.Match3Game.actions(node.state):
                 child = self._child_node(node.state, node, action)
+                child_key = hash(child.state)
 
-                if child not in explored:
+                if child_key not in explored:
                     nodes_generated += 1
                     self._log_progress(child)
 
@@ -136,7 +138,7 @@ class Solver:
                     ):
                         return child
 
-                    explored.add(child)
+                    explored.add(child_key)
                     frontier.put((h(child), nodes_generated, child))
 
         return None
@@ -173,13 +175,12 @@ class Solver:
         if limit == 0:
             return None
 
-        children = []
-        for action in match3.Match3Game.actions(node.state):
+        # Shuffle the actions rather than the children so each child is
+        # only built when visited and dropped again on backtrack.
+        actions = match3.Match3Game.actions(node.state)
+        random.shuffle(actions)
+        for action in actions:
             child = self._child_node(node.state, node, action)
-            children.append(child)
-
-        random.shuffle(children)
-        for child in children:
             result = self._recursive_dls(child, limit - 1)
             self._log_progress(child)
             if result:
@@ -6,7 +6,22 @@ import typing
 
 
 class State:
-    """Immutable snapshot of a match-3 game state."""
+    """Immutable snapshot of a match-3 game state.
+
+    ``max_swaps`` and ``number_of_device_types`` are fixed for a game and
+    are handed from parent to child unchanged, so equality and hashing only
+    look at the fields that differ between states.
+    """
+
+    __slots__ = (
+        "grid",
+        "pool",
+        "swaps",
+        "max_swaps",
+        "points",
+        "number_of_device_types",
+        "_hash",
+    )
 
     def __init__(
         self,
@@ -33,13 +48,41 @@ class State:
         self.max_swaps = max_swaps
         self.points = points
         self.number_of_device_types = number_of_device_types
+        self._hash: typing.Optional[int] = None
 
     def __eq__(self, other: object) -> bool:
         """Check state equality."""
         if not isinstance(other, State):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return (
+            self.swaps == other.swaps
+            and self.points == other.points
+            and self.grid == other.grid
+            and self.pool == other.pool
+        )
+
+    def __hash__(self) -> int:
+        """Hash based on board, pool, swaps, and score.
+
+        The value is computed on first use and cached, since a state is
+        never modified once built.
+        """
+        if self._hash is None:
+            self._hash = hash((
+                tuple(map(tuple, self.grid)),
+                tuple(map(tuple, self.pool)),
+                self.swaps,
+                self.points,
+            ))
+        return self._hash
 
     def __str__(self) -> str:
         """Return string representation."""
-        return str(self.__dict__)
+        return str({
+            "grid": self.grid,
+            "pool": self.pool,
+            "swaps": self.swaps,
+            "max_swaps": self.max_swaps,
+            "points": self.points,
+            "number_of_device_types": self.number_of_device_types,
+        })
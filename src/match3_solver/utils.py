@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import argparse
+import collections
+import io
 import os
 import sys
+import types
 import typing
 
 import direction as direction_module
@@ -12,30 +14,131 @@ import match3
 import search_node as search_node_module
 
 
+_SOLVER_USAGE = (
+    "usage: {prog} [-h] [--solution_path solution-path] puzzle-path"
+)
+
+_SOLVER_HELP = """
+An AI to solve match-3 puzzles
+
+positional arguments:
+  puzzle-path           The input puzzle file
+
+options:
+  -h, --help            show this help message and exit
+  --solution_path solution-path
+                        Output path for the solution
+"""
+
+
 def parse_arguments() -> tuple[str, typing.Optional[str]]:
     """Parses command line arguments.
 
     Returns:
         Tuple of (puzzle_path, solution_path or None).
     """
-    parser = argparse.ArgumentParser(
-        description="An AI to solve match-3 puzzles"
-    )
-    parser.add_argument(
-        "puzzle_path",
-        metavar="puzzle-path",
-        type=str,
-        help="The input puzzle file",
-    )
-    parser.add_argument(
-        "--solution_path",
-        metavar="solution-path",
-        type=str,
-        help="Output path for the solution",
+    positionals, options = parse_command_line(
+        sys.argv[1:],
+        _SOLVER_USAGE,
+        _SOLVER_HELP,
+        value_options=("--solution_path",),
     )
 
-    arguments = parser.parse_args()
-    return arguments.puzzle_path, arguments.solution_path
+    if not positionals:
+        usage_error(
+            _SOLVER_USAGE,
+            "the following arguments are required: puzzle-path",
+        )
+    if len(positionals) > 1:
+        usage_error(
+            _SOLVER_USAGE,
+            f"unrecognized arguments: {' '.join(positionals[1:])}",
+        )
+
+    return positionals[0], options.get("--solution_path")
+
+
+def parse_command_line(
+    arguments: typing.Sequence[str],
+    usage: str,
+    help_text: str,
+    value_options: typing.Collection[str] = (),
+    flag_options: typing.Collection[str] = (),
+) -> typing.Tuple[typing.List[str], typing.Dict[str, typing.Optional[str]]]:
+    """Splits command line arguments into positionals and options.
+
+    A minimal stand-in for argparse for the fixed solver and visualizer
+    command lines, which keeps argparse's import and parser construction
+    off CLI startup. -h/--help prints the help and exits; bad options exit
+    with status 2 like argparse.
+
+    Args:
+        arguments: Arguments after the program name.
+        usage: Usage line; "{prog}" is replaced by the program name.
+        help_text: Text printed after the usage line for -h/--help.
+        value_options: Options taking a value, as "--name value" or
+            "--name=value".
+        flag_options: Options taking no value.
+
+    Returns:
+        Tuple of (positional arguments, {option: value}). Flags that were
+        given map to None.
+    """
+    positionals: typing.List[str] = []
+    options: typing.Dict[str, typing.Optional[str]] = {}
+    unrecognized: typing.List[str] = []
+
+    index = 0
+    while index < len(arguments):
+        argument = arguments[index]
+        index += 1
+
+        if argument in ("-h", "--help"):
+            print(usage.format(prog=os.path.basename(sys.argv[0])))
+            print(help_text, end="")
+            sys.exit(0)
+        if argument == "--":
+            positionals.extend(arguments[index:])
+            break
+        if not argument.startswith("-") or argument == "-":
+            positionals.append(argument)
+            continue
+
+        name, has_value, value = argument.partition("=")
+        if name in value_options:
+            if not has_value:
+                if (
+                    index >= len(arguments)
+                    or arguments[index].startswith("-")
+                ):
+                    usage_error(
+                        usage, f"argument {name}: expected one argument"
+                    )
+                value = arguments[index]
+                index += 1
+            options[name] = value
+        elif name in flag_options and not has_value:
+            options[name] = None
+        else:
+            unrecognized.append(argument)
+
+    if unrecognized:
+        usage_error(usage, f"unrecognized arguments: {' '.join(unrecognized)}")
+
+    return positionals, options
+
+
+def usage_error(usage: str, message: str) -> typing.NoReturn:
+    """Prints usage and an error to stderr, then exits with status 2.
+
+    Args:
+        usage: Usage line; "{prog}" is replaced by the program name.
+        message: Error description.
+    """
+    program = os.path.basename(sys.argv[0])
+    print(usage.format(prog=program), file=sys.stderr)
+    print(f"{program}: error: {message}", file=sys.stderr)
+    sys.exit(2)
 
 
 def get_file_contents(filename: str) -> str:
@@ -55,7 +158,7 @@ def get_file_contents(filename: str) -> str:
         return f.read()
 
 
-def parse_game_parameters(file_contents: str) -> argparse.Namespace:
+def parse_game_parameters(file_contents: str) -> types.SimpleNamespace:
     """Parses game parameters from puzzle file contents.
 
     Args:
@@ -64,7 +167,8 @@ def parse_game_parameters(file_contents: str) -> argparse.Namespace:
     Returns:
         Namespace with game configuration.
     """
-    lines = file_contents.split("\n")
+    # Read only the lines the puzzle needs instead of splitting the file.
+    puzzle_file = io.StringIO(file_contents)
 
     (
         quota,
@@ -74,21 +178,21 @@ def parse_game_parameters(file_contents: str) -> argparse.Namespace:
         row_max,
         pool_height,
         bonuses_being_used,
-    ) = [int(x) for x in lines[:7]]
-
-    pool = [
-        [int(x) for x in line.split(" ")]
-        for line in lines[7 : 7 + pool_height]
-    ]
+    ) = map(int, (puzzle_file.readline() for _ in range(7)))
 
-    grid_start = 7 + pool_height
-    grid_end = grid_start + row_max
-    grid = [
-        [int(x) for x in line.split(" ")]
-        for line in lines[grid_start:grid_end]
+    # Tokenize the pool and grid rows as one block, then cut it into rows.
+    tile_lines = " ".join(
+        puzzle_file.readline() for _ in range(pool_height + row_max)
+    )
+    tiles = list(map(int, tile_lines.split()))
+    rows = [
+        tiles[start : start + column_max]
+        for start in range(0, len(tiles), column_max)
     ]
+    pool = rows[:pool_height]
+    grid = rows[pool_height:]
 
-    return argparse.Namespace(
+    return types.SimpleNamespace(
         quota=quota,
         swaps_allowed=swaps_allowed,
         device_types=device_types,
@@ -101,7 +205,9 @@ def parse_game_parameters(file_contents: str) -> argparse.Namespace:
     )
 
 
-def create_game_from_params(params: argparse.Namespace) -> match3.Match3Game:
+def create_game_from_params(
+    params: types.SimpleNamespace,
+) -> match3.Match3Game:
     """Creates a Match3Game from parsed parameters.
 
     Args:
@@ -123,26 +229,6 @@ def create_game_from_params(params: argparse.Namespace) -> match3.Match3Game:
     )
 
 
-def calculate_new_position(
-    row_column_pair: tuple[int, int],
-    direction: direction_module.Direction,
-) -> tuple[int, int]:
-    """Calculates the position after moving in a direction.
-
-    Args:
-        row_column_pair: Starting (row, column).
-        direction: Direction to move.
-
-    Returns:
-        New (row, column) position.
-    """
-    unit_vector = direction.unit_vector
-    return (
-        row_column_pair[0] + unit_vector[0],
-        row_column_pair[1] + unit_vector[1],
-    )
-
-
 def extract_swaps(
     node: search_node_module.SearchNode,
     game: match3.Match3Game,
@@ -157,25 +243,25 @@ def extract_swaps(
         List of ((old_x, old_y), (new_x, new_y)) swap tuples.
     """
     runner: typing.Optional[search_node_module.SearchNode] = node
-    swaps: typing.List[
+    pool_height = game.pool_height
+    swaps: typing.Deque[
         typing.Tuple[typing.Tuple[int, int], typing.Tuple[int, int]]
-    ] = []
+    ] = collections.deque()
 
     while runner is not None and runner.parent is not None:
-        before = runner.action.row_column_pair
-        after = calculate_new_position(
-            runner.action.row_column_pair,
-            runner.action.direction,
-        )
+        row, column = runner.action.row_column_pair
+        row_delta, column_delta = direction_module.UNIT_VECTORS[
+            runner.action.direction
+        ]
 
         # Convert to output format
-        before = (before[1], before[0] + game.pool_height)
-        after = (after[1], after[0] + game.pool_height)
-
-        swaps.append((before, after))
+        swaps.appendleft((
+            (column, row + pool_height),
+            (column + column_delta, row + row_delta + pool_height),
+        ))
         runner = runner.parent
 
-    return list(reversed(swaps))
+    return list(swaps)
 
 
 def format_swaps(
@@ -191,10 +277,7 @@ def format_swaps(
     Returns:
         Formatted string with newlines.
     """
-    lines = []
-    for before, after in swaps:
-        lines.append(f"{before}, {after}")
-    return "\n".join(lines)
+    return "\n".join(f"{before}, {after}" for before, after in swaps)
 
 
 def output_to_file(filename: str, content: str) -> None:
@@ -204,8 +287,8 @@ def output_to_file(filename: str, content: str) -> None:
         filename: Output path.
         content: Content to write.
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
+    with open(filename, "wb") as f:
+        f.write(content.encode("utf-8"))
 
 
 def output_solution(
@@ -214,6 +297,7 @@ def output_solution(
     elapsed_time: float,
     solution_node: search_node_module.SearchNode,
     game: match3.Match3Game,
+    file_contents: typing.Optional[str] = None,
 ) -> None:
     """Outputs the solution to stdout and optionally to a file.
 
@@ -223,8 +307,11 @@ def output_solution(
         elapsed_time: Time taken to solve.
         solution_node: The solution SearchNode.
         game: The game instance.
+        file_contents: Puzzle file text if already loaded; otherwise it is
+            read again from input_path.
     """
-    file_contents = get_file_contents(input_path)
+    if file_contents is None:
+        file_contents = get_file_contents(input_path)
     swap_string = format_swaps(extract_swaps(solution_node, game))
 
     print(file_contents)
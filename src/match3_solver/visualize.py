@@ -3,8 +3,8 @@
 
 from __future__ import annotations
 
-import argparse
 import sys
+import types
 
 import heuristic
 import solver
@@ -12,39 +12,61 @@ import utils
 import visualizer
 
 
-def parse_arguments() -> argparse.Namespace:
+_USAGE = (
+    "usage: {prog} [-h] [--delay DELAY] [--step] [--no-emoji] puzzle-path"
+)
+
+_HELP = """
+Visualize a match-3 puzzle solution
+
+positional arguments:
+  puzzle-path    Path to the puzzle input file
+
+options:
+  -h, --help     show this help message and exit
+  --delay DELAY  Delay between animation frames in seconds (default: 0.5)
+  --step         Step through moves manually (press Enter between moves)
+  --no-emoji     Use colored numbers instead of emoji tiles
+"""
+
+
+def parse_arguments() -> types.SimpleNamespace:
     """Parse command line arguments.
 
     Returns:
         Namespace with puzzle_path, delay, and step options.
     """
-    parser = argparse.ArgumentParser(
-        description="Visualize a match-3 puzzle solution"
-    )
-    parser.add_argument(
-        "puzzle_path",
-        metavar="puzzle-path",
-        type=str,
-        help="Path to the puzzle input file",
-    )
-    parser.add_argument(
-        "--delay",
-        type=float,
-        default=0.5,
-        help="Delay between animation frames in seconds (default: 0.5)",
-    )
-    parser.add_argument(
-        "--step",
-        action="store_true",
-        help="Step through moves manually (press Enter between moves)",
-    )
-    parser.add_argument(
-        "--no-emoji",
-        action="store_true",
-        help="Use colored numbers instead of emoji tiles",
+    positionals, options = utils.parse_command_line(
+        sys.argv[1:],
+        _USAGE,
+        _HELP,
+        value_options=("--delay",),
+        flag_options=("--step", "--no-emoji"),
     )
 
-    return parser.parse_args()
+    if not positionals:
+        utils.usage_error(
+            _USAGE, "the following arguments are required: puzzle-path"
+        )
+    if len(positionals) > 1:
+        utils.usage_error(
+            _USAGE, f"unrecognized arguments: {' '.join(positionals[1:])}"
+        )
+
+    delay = options.get("--delay", "0.5")
+    try:
+        delay_seconds = float(delay)
+    except ValueError:
+        utils.usage_error(
+            _USAGE, f"argument --delay: invalid float value: '{delay}'"
+        )
+
+    return types.SimpleNamespace(
+        puzzle_path=positionals[0],
+        delay=delay_seconds,
+        step="--step" in options,
+        no_emoji="--no-emoji" in options,
+    )
 
 
 def main() -> None:
@@ -2,26 +2,27 @@
 
 from __future__ import annotations
 
-import copy
 import sys
 import time
 import typing
 
-from rich.console import Console
-from rich.layout import Layout
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import BarColumn
-from rich.progress import Progress
-from rich.progress import TextColumn
-from rich.table import Table
-from rich.text import Text
-
 import action as action_module
 import match3
 import search_node as search_node_module
 import state as state_module
 
+# rich is imported where it is used so that importing this module stays
+# cheap; these imports only serve the type annotations.
+if typing.TYPE_CHECKING:
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+# Bit flags for highlighted cells in render_grid.
+_SWAP_HIGHLIGHT = 1
+_MATCH_HIGHLIGHT = 2
+
 
 class Match3Visualizer:
     """Terminal-based match-3 game visualizer with animations."""
@@ -40,6 +41,8 @@ class Match3Visualizer:
         "bright_white",
     ]
 
+    _MAX_TILE = len(TILE_EMOJIS)
+
     def __init__(
         self,
         game: match3.Match3Game,
@@ -55,6 +58,12 @@ class Match3Visualizer:
             step_mode: If True, wait for input between moves.
             use_emoji: If True, use emoji tiles instead of numbers.
         """
+        from rich.console import Console
+        from rich.layout import Layout
+        from rich.progress import BarColumn
+        from rich.progress import Progress
+        from rich.progress import TextColumn
+
         self.game = game
         self.delay = delay
         self.step_mode = step_mode
@@ -62,6 +71,33 @@ class Match3Visualizer:
         self.console = Console()
         self.combo_count = 0
         self.last_points_earned = 0
+        self._tile_cache: typing.Dict[
+            typing.Tuple[int, bool, bool, bool, bool, bool], Text
+        ] = {}
+
+        # Frame widgets are built once and refreshed in place every frame.
+        self._progress = Progress(
+            TextColumn("[bold blue]Score:"),
+            BarColumn(bar_width=20, complete_style="green", finished_style="green"),
+            TextColumn("[bold]{task.completed}/{task.total}"),
+            expand=False,
+        )
+        self._score_task = self._progress.add_task(
+            "score", total=game.quota, completed=0
+        )
+        self._status_text_layout = Layout(name="text")
+        self._status_layout = Layout()
+        self._status_layout.split_column(
+            Layout(self._progress, size=1),
+            self._status_text_layout,
+        )
+        self._grid_layout = Layout(name="grid")
+        self._status_panel_layout = Layout(name="status")
+        self._display_layout = Layout()
+        self._display_layout.split_column(
+            self._grid_layout,
+            self._status_panel_layout,
+        )
 
     def _render_tile(
         self,
@@ -73,6 +109,10 @@ class Match3Visualizer:
     ) -> Text:
         """Render a single tile.
 
+        Only a few dozen distinct tiles exist, so each one is built once
+        and the same Text is returned afterwards. Callers must not modify
+        it.
+
         Args:
             tile_value: The tile type (1-7).
             is_highlight: Whether this tile is being swapped.
@@ -83,14 +123,44 @@ class Match3Visualizer:
         Returns:
             Rich Text object for the tile.
         """
-        if tile_value < 1 or tile_value > len(self.TILE_EMOJIS):
-            if self.use_emoji:
+        tile_cache = self._tile_cache
+        key = (
+            tile_value,
+            is_highlight,
+            is_match,
+            is_pool,
+            flash_on,
+            self.use_emoji,
+        )
+        text = tile_cache.get(key)
+        if text is None:
+            text = self._build_tile(
+                tile_value, is_highlight, is_match, is_pool, flash_on
+            )
+            tile_cache[key] = text
+        return text
+
+    def _build_tile(
+        self,
+        tile_value: int,
+        is_highlight: bool,
+        is_match: bool,
+        is_pool: bool,
+        flash_on: bool,
+    ) -> Text:
+        """Build the Text for a single tile; see _render_tile."""
+        from rich.text import Text
+
+        use_emoji = self.use_emoji
+
+        if tile_value < 1 or tile_value > self._MAX_TILE:
+            if use_emoji:
                 return Text("  ⬛  ", style="dim")
             return Text(" ? ", style="dim")
 
         color = self.TILE_COLORS[tile_value - 1]
 
-        if self.use_emoji:
+        if use_emoji:
             emoji = self.TILE_EMOJIS[tile_value - 1]
             if is_match and not flash_on:
                 return Text("  ✨  ", style="bold")
@@ -133,10 +203,18 @@ class Match3Visualizer:
         Returns:
             Rich Table representing the grid.
         """
-        swap_highlights = swap_highlights or set()
-        match_highlights = match_highlights or set()
+        from rich.table import Table
+        from rich.text import Text
 
-        row_max, column_max = match3.Match3Game.grid_size(state.grid)
+        column_max = len(state.grid[0])
+
+        # Flag highlighted cells in a flat bitmap indexed by
+        # row * column_max + col so the cell loop avoids tuple set lookups.
+        highlights = bytearray(len(state.grid) * column_max)
+        for row, col in swap_highlights or ():
+            highlights[row * column_max + col] |= _SWAP_HIGHLIGHT
+        for row, col in match_highlights or ():
+            highlights[row * column_max + col] |= _MATCH_HIGHLIGHT
 
         table = Table(
             show_header=True,
@@ -150,13 +228,13 @@ class Match3Visualizer:
         for col in range(column_max):
             table.add_column(str(col), justify="center", width=col_width)
 
+        render_tile = self._render_tile
+
         if show_pool:
-            pool_row_max = len(state.pool)
-            for pool_row in range(pool_row_max):
+            for pool_tiles in state.pool:
                 row_cells = [Text("·", style="dim")]
-                for col in range(column_max):
-                    tile = state.pool[pool_row][col]
-                    row_cells.append(self._render_tile(tile, is_pool=True))
+                for tile in pool_tiles:
+                    row_cells.append(render_tile(tile, is_pool=True))
                 table.add_row(*row_cells)
 
             separator = "─────" if self.use_emoji else "───"
@@ -165,14 +243,17 @@ class Match3Visualizer:
                 separator_cells.append(Text(separator, style="dim cyan"))
             table.add_row(*separator_cells)
 
-        for row in range(row_max):
+        for row, grid_tiles in enumerate(state.grid):
             row_cells = [Text(str(row), style="bold cyan")]
-            for col in range(column_max):
-                tile = state.grid[row][col]
-                is_swap = (row, col) in swap_highlights
-                is_match = (row, col) in match_highlights
-                row_cells.append(self._render_tile(
-                    tile, is_swap, is_match, flash_on=flash_on
+            index = row * column_max
+            for tile in grid_tiles:
+                flags = highlights[index]
+                index += 1
+                row_cells.append(render_tile(
+                    tile,
+                    bool(flags & _SWAP_HIGHLIGHT),
+                    bool(flags & _MATCH_HIGHLIGHT),
+                    flash_on=flash_on,
                 ))
             table.add_row(*row_cells)
 
@@ -200,13 +281,14 @@ class Match3Visualizer:
         Returns:
             Rich Panel with status information.
         """
-        progress = Progress(
-            TextColumn("[bold blue]Score:"),
-            BarColumn(bar_width=20, complete_style="green", finished_style="green"),
-            TextColumn("[bold]{task.completed}/{task.total}"),
-            expand=False,
+        from rich.panel import Panel
+        from rich.text import Text
+
+        self._progress.update(
+            self._score_task,
+            total=self.game.quota,
+            completed=min(state.points, self.game.quota),
         )
-        progress.add_task("score", total=self.game.quota, completed=min(state.points, self.game.quota))
 
         status_text = Text()
         status_text.append(f"Swaps: {state.swaps}/{state.max_swaps}", style="bold")
@@ -236,13 +318,10 @@ class Match3Visualizer:
             status_text.append("\n")
             status_text.append("[Enter]=next  [q]=quit  [+/-]=speed", style="dim")
 
-        layout = Layout()
-        layout.split_column(
-            Layout(progress, size=1),
-            Layout(status_text, size=3 if self.step_mode else 2),
-        )
+        self._status_text_layout.update(status_text)
+        self._status_text_layout.size = 3 if self.step_mode else 2
 
-        return Panel(layout, title="Status", border_style="blue")
+        return Panel(self._status_layout, title="Status", border_style="blue")
 
     def render_display(
         self,
@@ -257,26 +336,40 @@ class Match3Visualizer:
         combo: int = 0,
     ) -> Panel:
         """Render the complete display."""
-        grid = self.render_grid(
-            state, swap_highlights, match_highlights, flash_on=flash_on
-        )
+        from rich.panel import Panel
+
         status = self.render_status(
             state, swap_num, total_swaps, move_description,
             points_earned, combo
         )
 
-        layout = Layout()
-        layout.split_column(
-            Layout(Panel(grid, title="Grid", border_style="green"), name="grid"),
-            Layout(status, name="status", size=7 if self.step_mode else 6),
-        )
+        self._grid_layout.update(self._render_grid_panel(
+            state, swap_highlights, match_highlights, flash_on
+        ))
+        self._status_panel_layout.update(status)
+        self._status_panel_layout.size = 7 if self.step_mode else 6
 
         return Panel(
-            layout,
+            self._display_layout,
             title="[bold magenta]🎮 Match-3 Puzzle Visualizer 🎮[/bold magenta]",
             border_style="magenta",
         )
 
+    def _render_grid_panel(
+        self,
+        state: state_module.State,
+        swap_highlights: typing.Optional[typing.Set[typing.Tuple[int, int]]],
+        match_highlights: typing.Optional[typing.Set[typing.Tuple[int, int]]],
+        flash_on: bool,
+    ) -> Panel:
+        """Render the grid wrapped in its display panel."""
+        from rich.panel import Panel
+
+        grid = self.render_grid(
+            state, swap_highlights, match_highlights, flash_on=flash_on
+        )
+        return Panel(grid, title="Grid", border_style="green")
+
     def extract_solution_path(
         self,
         solution_node: search_node_module.SearchNode,
@@ -291,7 +384,8 @@ class Match3Visualizer:
             path.append((runner.state, runner.action))
             runner = runner.parent
 
-        return list(reversed(path))
+        path.reverse()
+        return path
 
     def get_swap_positions(
         self,
@@ -324,14 +418,22 @@ class Match3Visualizer:
             live: Rich Live context.
             flash_count: Number of flashes.
         """
+        # Only the matched tiles change between flash frames, so the
+        # display and both grid variants are rendered once and alternated.
+        display = self.render_display(
+            state, swap_num, total_swaps,
+            f"{move_desc} - {len(matches)} tiles matched!",
+            match_highlights=matches,
+            flash_on=True,
+        )
+        grid_panels = (
+            self._grid_layout.renderable,
+            self._render_grid_panel(state, None, matches, False),
+        )
+
         for i in range(flash_count * 2):
-            flash_on = (i % 2 == 0)
-            live.update(self.render_display(
-                state, swap_num, total_swaps,
-                f"{move_desc} - {len(matches)} tiles matched!",
-                match_highlights=matches,
-                flash_on=flash_on,
-            ))
+            self._grid_layout.update(grid_panels[i % 2])
+            live.update(display)
             time.sleep(self.delay / 4)
 
     def animate_cascade(
@@ -347,25 +449,31 @@ class Match3Visualizer:
     ) -> int:
         """Animate the cascade with tiles falling and chain combos.
 
+        grid_before and pool_before are copied once and left unmodified.
+
         Returns:
             Total combo count for this move.
         """
-        temp_grid = copy.deepcopy(grid_before)
-        temp_pool = copy.deepcopy(pool_before)
+        temp_grid = [row[:] for row in grid_before]
+        temp_pool = [row[:] for row in pool_before]
         current_points = points_before
         combo = 0
 
-        while match3.Match3Game.match_exists(temp_grid):
+        # Scratch state for rendering only: reduce mutates its grid and
+        # pool in place and the score is updated per step, so it is
+        # never hashed.
+        temp_state = state_module.State(
+            temp_grid, temp_pool,
+            state_after.swaps, state_after.max_swaps,
+            current_points, state_after.number_of_device_types
+        )
+
+        matches = match3.Match3Game.find_all_points_of_matches(temp_grid)
+        while matches:
             combo += 1
-            matches = match3.Match3Game.find_all_points_of_matches(temp_grid)
             points_from_match = len(matches)
             current_points += points_from_match
-
-            temp_state = state_module.State(
-                temp_grid, temp_pool,
-                state_after.swaps, state_after.max_swaps,
-                current_points, state_after.number_of_device_types
-            )
+            temp_state.points = current_points
 
             self.flash_matches(
                 temp_state, matches, swap_num, total_swaps, move_desc, live
@@ -381,14 +489,9 @@ class Match3Visualizer:
             ))
             time.sleep(self.delay / 2)
 
-            match3.Match3Game.reduce(
-                temp_grid, temp_pool, state_after.number_of_device_types
-            )
-
-            temp_state = state_module.State(
-                temp_grid, temp_pool,
-                state_after.swaps, state_after.max_swaps,
-                current_points, state_after.number_of_device_types
+            matches = match3.Match3Game.cascade_step(
+                temp_grid, temp_pool, state_after.number_of_device_types,
+                matches,
             )
 
             cascade_msg = "tiles falling..." if combo == 1 else f"chain reaction! ({combo}x)"
@@ -426,7 +529,7 @@ class Match3Visualizer:
         ))
         time.sleep(self.delay)
 
-        temp_grid = copy.deepcopy(before_state.grid)
+        temp_grid = [row[:] for row in before_state.grid]
         match3.Match3Game.swap(temp_grid, action.row_column_pair, action.direction)
 
         temp_state = state_module.State(
@@ -442,7 +545,7 @@ class Match3Visualizer:
         time.sleep(self.delay / 2)
 
         combo = self.animate_cascade(
-            temp_grid, copy.deepcopy(before_state.pool),
+            temp_grid, before_state.pool,
             after_state, swap_num, total_swaps, move_desc,
             before_state.points, live
         )
@@ -465,31 +568,37 @@ class Match3Visualizer:
         Returns:
             Command string: 'next', 'quit', 'faster', 'slower'
         """
-        try:
-            user_input = input().strip().lower()
-            if user_input == 'q':
-                return 'quit'
-            elif user_input == '+':
-                self.delay = max(0.1, self.delay - 0.1)
-                return 'faster'
-            elif user_input == '-':
-                self.delay = min(2.0, self.delay + 0.1)
-                return 'slower'
-            else:
-                return 'next'
-        except EOFError:
+        line = sys.stdin.readline()
+        if not line:
+            # readline returns an empty string only at end of input.
             return 'quit'
 
+        user_input = line.strip().lower()
+        if user_input == 'q':
+            return 'quit'
+        elif user_input == '+':
+            self.delay = max(0.1, self.delay - 0.1)
+            return 'faster'
+        elif user_input == '-':
+            self.delay = min(2.0, self.delay + 0.1)
+            return 'slower'
+        else:
+            return 'next'
+
     def play_solution(
         self,
         solution_node: search_node_module.SearchNode,
     ) -> None:
         """Play through the complete solution with animation."""
+        from rich.live import Live
+
         path = self.extract_solution_path(solution_node)
+        states = tuple(state for state, _ in path)
+        actions = tuple(action for _, action in path)
         total_swaps = len(path) - 1
 
         with Live(console=self.console, refresh_per_second=20) as live:
-            initial_state = path[0][0]
+            initial_state = states[0]
             start_msg = "Press Enter to start..." if self.step_mode else "Starting..."
             live.update(self.render_display(
                 initial_state, 0, total_swaps, start_msg
@@ -502,18 +611,17 @@ class Match3Visualizer:
             else:
                 time.sleep(self.delay * 2)
 
-            for i in range(1, len(path)):
-                before_state = path[i - 1][0]
-                after_state, action = path[i]
+            for i in range(1, len(states)):
+                action = actions[i]
 
                 if action is not None:
                     self.animate_move(
-                        before_state, action, after_state, i, total_swaps, live
+                        states[i - 1], action, states[i], i, total_swaps, live
                     )
 
-                    if self.step_mode and i < len(path) - 1:
+                    if self.step_mode and i < total_swaps:
                         live.update(self.render_display(
-                            after_state, i, total_swaps,
+                            states[i], i, total_swaps,
                             f"Move {i} complete. Press Enter...",
                             points_earned=self.last_points_earned,
                             combo=self.combo_count,
@@ -522,7 +630,7 @@ class Match3Visualizer:
                         if cmd == 'quit':
                             return
 
-            final_state = path[-1][0]
+            final_state = states[-1]
             won = final_state.points >= self.game.quota
 
             result_msg = (
@@ -12,192 +12,351 @@ Run with --help for full options.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
+import os
+import shutil
 import sys
 import time
+import zlib
 from pathlib import Path
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser with subcommands.
+def _add_sat_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``sat`` subcommand's options.
 
-    Returns:
-        Configured argument parser.
+    Args:
+        parser: Subcommand parser to populate.
     """
-    parser = argparse.ArgumentParser(
-        description="Artificial Intelligence Algorithm Runner",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-    python -m run sat --input input.cnf
-    python -m run shape-pack --input shapes.txt --mu 100
-    python -m run hill-climb --function sphere
-        """,
-    )
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # SAT Solver subcommand
-    sat_parser = subparsers.add_parser(
-        "sat",
-        help="SAT solver using evolutionary algorithm",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    sat_parser.add_argument(
+    parser.add_argument(
         "--input", "-i",
         type=Path,
         required=True,
         help="CNF file",
     )
-    sat_parser.add_argument(
+    parser.add_argument(
         "--mu",
         type=int,
         default=100,
         help="Parent population size",
     )
-    sat_parser.add_argument(
+    parser.add_argument(
         "--lambda",
         dest="lambda_",
         type=int,
         default=50,
         help="Offspring per generation",
     )
-    sat_parser.add_argument(
+    parser.add_argument(
         "--target-fitness",
         type=float,
         default=100.0,
         help="Target fitness (100 = all clauses satisfied)",
     )
-    sat_parser.add_argument(
+    parser.add_argument(
         "--max-evals",
         type=int,
         default=100000,
         help="Maximum fitness evaluations",
     )
-    sat_parser.add_argument(
+    parser.add_argument(
         "--seed",
         type=int,
         default=None,
         help="Random seed",
     )
 
-    # Shape Packer subcommand
-    pack_parser = subparsers.add_parser(
-        "shape-pack",
-        help="Shape packing using evolutionary algorithm",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    pack_parser.add_argument(
+
+def _add_shape_pack_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``shape-pack`` subcommand's options.
+
+    Args:
+        parser: Subcommand parser to populate.
+    """
+    parser.add_argument(
         "--input", "-i",
         type=Path,
         required=True,
         help="Shapes file",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--output", "-o",
         type=Path,
         default=None,
         help="Output file for solution",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--mu",
         type=int,
         default=100,
         help="Parent population size",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--lambda",
         dest="lambda_",
         type=int,
         default=50,
         help="Offspring per generation",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--mutation-rate",
         type=float,
         default=0.05,
         help="Mutation probability",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--max-evals",
         type=int,
         default=10000,
         help="Maximum fitness evaluations",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--stagnation",
         type=int,
         default=250,
         help="Generations without improvement to terminate",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--seed",
         type=int,
         default=None,
         help="Random seed",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to create offspring (or to draw GIF frames "
+        "with --save)",
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=1,
+        help="Sub-populations evolved in parallel with periodic migration "
+        "(not with --visualize)",
+    )
+    parser.add_argument(
         "--visualize", "-v",
         action="store_true",
         help="Show real-time visualization",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--interval",
         type=int,
         default=5,
         help="Update visualization every N generations (with --visualize)",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
+        "--max-fps",
+        type=float,
+        default=20,
+        help="Redraw the live visualization at most this many times per "
+        "second, evolving in between (0 to draw every interval)",
+    )
+    parser.add_argument(
         "--save",
         type=Path,
         default=None,
         help="Save animation as GIF (e.g., --save=run.gif). Implies --visualize",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--duration",
         type=int,
         default=None,
         help="Duration in seconds for GIF recording (with --save)",
     )
-    pack_parser.add_argument(
+    parser.add_argument(
         "--generations",
         type=int,
         default=None,
         help="Number of generations for GIF recording (with --save). Overrides --duration",
     )
 
-    # Hill Climber subcommand
-    hill_parser = subparsers.add_parser(
-        "hill-climb",
-        help="Hill climbing local search",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    hill_parser.add_argument(
+
+def _add_hill_climb_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``hill-climb`` subcommand's options.
+
+    Args:
+        parser: Subcommand parser to populate.
+    """
+    parser.add_argument(
         "--function", "-f",
         type=str,
         default="sphere",
         choices=["sphere", "rastrigin", "ackley"],
         help="Objective function",
     )
-    hill_parser.add_argument(
+    parser.add_argument(
         "--strategy",
         type=str,
         default="steepest",
         choices=["steepest", "stochastic"],
         help="Search strategy",
     )
-    hill_parser.add_argument(
+    parser.add_argument(
         "--restarts",
         type=int,
         default=10,
         help="Number of random restarts",
     )
-    hill_parser.add_argument(
+    parser.add_argument(
         "--seed",
         type=int,
         default=None,
         help="Random seed",
     )
 
+
+# Subcommand name -> (one-line help, function adding its options)
+_SUBCOMMANDS = {
+    "sat": (
+        "SAT solver using evolutionary algorithm",
+        _add_sat_arguments,
+    ),
+    "shape-pack": (
+        "Shape packing using evolutionary algorithm",
+        _add_shape_pack_arguments,
+    ),
+    "hill-climb": (
+        "Hill climbing local search",
+        _add_hill_climb_arguments,
+    ),
+}
+
+
+def _invoked_command(argv: list[str]) -> str | None:
+    """Find the subcommand named on the command line.
+
+    The top-level parser only takes ``--help``, so the first token that is
+    not an option is the subcommand.
+
+    Args:
+        argv: Command line arguments.
+
+    Returns:
+        The first positional token, or None if there is none.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+    return None
+
+
+_HELP_FLAGS = ("-h", "--help")
+
+
+def _help_topic(argv: list[str]) -> str | None:
+    """Recognize a bare help request.
+
+    Args:
+        argv: Command line arguments.
+
+    Returns:
+        ``"main"`` for ``--help``, the subcommand name for
+        ``<subcommand> --help``, or None for any other command line.
+    """
+    if len(argv) == 1 and argv[0] in _HELP_FLAGS:
+        return "main"
+    if len(argv) == 2 and argv[0] in _SUBCOMMANDS and argv[1] in _HELP_FLAGS:
+        return argv[0]
+    return None
+
+
+def _help_cache_path(topic: str) -> Path:
+    """Get the cache file for the help text of ``topic``.
+
+    The name is keyed by the mtime of this file, so editing the CLI
+    invalidates it, plus the program name, terminal width and Python
+    version, which all shape argparse's formatted text.
+
+    Args:
+        topic: ``"main"`` or a subcommand name.
+
+    Returns:
+        Path of the cache file (which may not exist yet).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    context = (
+        f"{sys.argv[0]}|{shutil.get_terminal_size().columns}"
+        f"|{sys.version_info[:2]}"
+    )
+    stamp = f"{Path(__file__).stat().st_mtime_ns}_{zlib.crc32(context.encode()):08x}"
+    return Path(cache_home) / "artificial" / f"help_{topic}_{stamp}.txt"
+
+
+def _print_help(topic: str, argv: list[str]) -> int:
+    """Print help text, reusing the on-disk copy from a previous run.
+
+    On a cache miss the help is formatted by argparse as usual, and the
+    result replaces any stale copies for the same topic. Cache errors are
+    ignored; they only cost the formatting time.
+
+    Args:
+        topic: ``"main"`` or a subcommand name.
+        argv: Command line arguments that asked for help.
+
+    Returns:
+        Exit code.
+    """
+    path = _help_cache_path(topic)
+    try:
+        sys.stdout.write(path.read_text())
+        return 0
+    except OSError:
+        pass
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.suppress(SystemExit):
+        create_parser(_invoked_command(argv)).parse_args(argv)
+    text = output.getvalue()
+    sys.stdout.write(text)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in path.parent.glob(f"help_{topic}_*.txt"):
+            stale.unlink()
+        path.write_text(text)
+    except OSError:
+        pass
+    return 0
+
+
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Create the argument parser with subcommands.
+
+    Every subcommand is registered so the top-level help lists them all,
+    but only the options of ``command`` are added when it is given.
+
+    Args:
+        command: Subcommand that will be parsed, or None to fully build
+            every subcommand.
+
+    Returns:
+        Configured argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Artificial Intelligence Algorithm Runner",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python -m run sat --input input.cnf
+    python -m run shape-pack --input shapes.txt --mu 100
+    python -m run hill-climb --function sphere
+        """,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(
+            name,
+            help=help_text,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        )
+        if command is None or command == name:
+            add_arguments(subparser)
+
     return parser
 
 
@@ -272,6 +431,12 @@ def run_shape_pack(args: argparse.Namespace) -> int:
         write_solution,
     )
 
+    # The visualized EA evolves a single population
+    if args.islands > 1 and (args.visualize or args.save):
+        print("Error: --islands cannot be used with --visualize or --save",
+              file=sys.stderr)
+        return 1
+
     print(f"Loading shapes from {args.input}...")
     try:
         shapes, board_dims = parse_input_file(args.input)
@@ -289,6 +454,8 @@ def run_shape_pack(args: argparse.Namespace) -> int:
         max_evaluations=args.max_evals,
         stagnation_generations=args.stagnation,
         seed=args.seed,
+        workers=args.workers,
+        islands=args.islands,
     )
 
     # Use visualizer if requested (--visualize or --save implies visualize)
@@ -325,6 +492,7 @@ def run_shape_pack(args: argparse.Namespace) -> int:
             max_generations=max_gens,
             save_path=args.save,
             duration_seconds=duration,
+            max_fps=args.max_fps or None,
         )
 
         start_time = time.time()
@@ -368,17 +536,16 @@ def run_hill_climb(args: argparse.Namespace) -> int:
     Returns:
         Exit code.
     """
+    import math
     import random
 
-    import numpy as np
-
     from hill_climber import Function, HillClimber, Node
 
     if args.seed is not None:
         random.seed(args.seed)
-        np.random.seed(args.seed)
 
-    # Define objective functions
+    # Define objective functions. They are called on one (x, y) pair at a
+    # time, where math's scalar functions are much cheaper than NumPy ufuncs.
     functions = {
         "sphere": (
             lambda x, y: -(x**2 + y**2),
@@ -386,16 +553,16 @@ def run_hill_climb(args: argparse.Namespace) -> int:
             (-5.0, 5.0),
         ),
         "rastrigin": (
-            lambda x, y: -(20 + x**2 - 10 * np.cos(2 * np.pi * x)
-                          + y**2 - 10 * np.cos(2 * np.pi * y)),
+            lambda x, y: -(20 + x**2 - 10 * math.cos(2 * math.pi * x)
+                          + y**2 - 10 * math.cos(2 * math.pi * y)),
             (-5.12, 5.12),
             (-5.12, 5.12),
         ),
         "ackley": (
-            lambda x, y: -(-20 * np.exp(-0.2 * np.sqrt(0.5 * (x**2 + y**2)))
-                          - np.exp(0.5 * (np.cos(2 * np.pi * x)
-                                          + np.cos(2 * np.pi * y)))
-                          + np.e + 20),
+            lambda x, y: -(-20 * math.exp(-0.2 * math.sqrt(0.5 * (x**2 + y**2)))
+                          - math.exp(0.5 * (math.cos(2 * math.pi * x)
+                                            + math.cos(2 * math.pi * y)))
+                          + math.e + 20),
             (-5.0, 5.0),
             (-5.0, 5.0),
         ),
@@ -434,7 +601,12 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code.
     """
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    topic = _help_topic(argv)
+    if topic is not None:
+        return _print_help(topic, argv)
+    parser = create_parser(_invoked_command(argv))
     args = parser.parse_args(argv)
 
     try:
@@ -16,28 +16,63 @@ Example:
     print(f"Best fitness: {best.fitness}")
 """
 
-from shape_packer.board import Board, Placement
-from shape_packer.config import ShapePackerConfig
-from shape_packer.ea import ShapePackerEA
-from shape_packer.individual import Individual
-from shape_packer.io import format_solution, parse_input_file, write_solution
-from shape_packer.operators import (
-    CrossoverOperator,
-    LocalSearchMutation,
-    MutationOperator,
-    RandomReplaceMutation,
-    UniformCrossover,
-)
-from shape_packer.population import Population
-from shape_packer.selection import (
-    FitnessProportionalSelection,
-    RandomSelection,
-    SelectionStrategy,
-    TournamentSelection,
-    TruncationSelection,
-)
-from shape_packer.shape import Point, Shape
-from shape_packer.visualize import ShapePackerVisualizer, VisualShapePackerEA
+import importlib
+from typing import Any, List
+
+# Public names and the submodule that defines each one. They are imported on
+# first access so that, for example, the CLI does not pay for matplotlib
+# unless the visualizer is actually used.
+_LAZY_ATTRIBUTES = {
+    "Board": "shape_packer.board",
+    "Placement": "shape_packer.board",
+    "ShapePackerConfig": "shape_packer.config",
+    "ShapePackerEA": "shape_packer.ea",
+    "Individual": "shape_packer.individual",
+    "format_solution": "shape_packer.io",
+    "parse_input_file": "shape_packer.io",
+    "write_solution": "shape_packer.io",
+    "CrossoverOperator": "shape_packer.operators",
+    "LocalSearchMutation": "shape_packer.operators",
+    "MutationOperator": "shape_packer.operators",
+    "RandomReplaceMutation": "shape_packer.operators",
+    "UniformCrossover": "shape_packer.operators",
+    "Population": "shape_packer.population",
+    "FitnessProportionalSelection": "shape_packer.selection",
+    "RandomSelection": "shape_packer.selection",
+    "SelectionStrategy": "shape_packer.selection",
+    "TournamentSelection": "shape_packer.selection",
+    "TruncationSelection": "shape_packer.selection",
+    "Point": "shape_packer.shape",
+    "Shape": "shape_packer.shape",
+    "ShapePackerVisualizer": "shape_packer.visualize",
+    "VisualShapePackerEA": "shape_packer.visualize",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access.
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The requested class or function.
+
+    Raises:
+        AttributeError: If name is not a public attribute of the package.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including not-yet-imported public names."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     # Core classes
@@ -2,7 +2,9 @@
 """Benchmark script for shape packer evolutionary algorithm.
 
 Tests all combinations of mu, lambda, and generations parameters.
-Runs 30 trials per configuration and saves the best GIF for each.
+Runs 30 trials per configuration and saves the best GIF for each. Trials
+run in-process across a worker pool; only the best trial of each
+configuration is replayed through ``run.py`` to render its GIF.
 
 Usage:
     python benchmark.py
@@ -10,11 +12,12 @@ Usage:
 """
 
 import argparse
-import os
-import shutil
+import random
 import subprocess
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Parameter grids to test
@@ -23,13 +26,39 @@ LAMBDA_VALUES = [10, 25, 50, 100, 250]
 GENERATION_VALUES = [10, 25, 50, 100, 250, 500, 1000]
 INPUT_FILES = ["input-1.txt", "input-2.txt", "input-3.txt"]
 OUTPUT_DIR = Path("../../assets/shape_packer")
-TEMP_DIR = Path("/tmp/shape_packer_benchmark")
 SRC_DIR = Path(__file__).parent.parent  # src/ directory
 
+# Trials run in-process, so shape_packer must be importable when this file
+# is run as a script from its own directory
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
 
-def run_single(input_file: str, mu: int, lambda_: int, generations: int, output_path: Path) -> tuple[float, float]:
-    """Run a single benchmark and return (fitness, elapsed_seconds)."""
-    import time
+
+def run_trial(input_file: str, mu: int, lambda_: int, generations: int, seed: int) -> tuple[float, float]:
+    """Run a single trial in-process and return (fitness, elapsed_seconds).
+
+    Runs the same EA as ``run.py shape-pack --save`` for the given number of
+    generations, without rendering, so the best trial can be replayed with
+    the same seed to produce its GIF.
+    """
+    from shape_packer.config import ShapePackerConfig
+    from shape_packer.io import parse_input_file
+    from shape_packer.visualize import VisualShapePackerEA
+
+    # parse_input_file memoizes, so each worker parses every input once
+    shapes, board_dims = parse_input_file(SRC_DIR / "shape_packer" / "input" / input_file)
+    config = ShapePackerConfig(mu=mu, lambda_=lambda_, seed=seed)
+
+    start = time.time()
+    ea = VisualShapePackerEA(shapes, board_dims, config)
+    ea.initialize()
+    while ea.generation < generations:
+        ea.step()
+    return ea.best.fitness, time.time() - start
+
+
+def save_gif(input_file: str, mu: int, lambda_: int, generations: int, seed: int, output_path: Path) -> None:
+    """Replay a trial through the visualizer CLI and save it as a GIF."""
     input_path = SRC_DIR / "shape_packer" / "input" / input_file
     cmd = [
         sys.executable, str(SRC_DIR / "run.py"), "shape-pack",
@@ -37,31 +66,17 @@ def run_single(input_file: str, mu: int, lambda_: int, generations: int, output_
         "--mu", str(mu),
         "--lambda", str(lambda_),
         "--generations", str(generations),
+        "--seed", str(seed),
         "--interval", "1",
         "--save", str(output_path),
     ]
-
-    start = time.time()
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    elapsed = time.time() - start
-    output = result.stdout + result.stderr
-
-    # Parse fitness from output
-    for line in output.split("\n"):
-        if "Best fitness:" in line:
-            try:
-                fitness = float(line.split("Best fitness:")[1].strip())
-                return fitness, elapsed
-            except (ValueError, IndexError):
-                pass
-    return 0.0, elapsed
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 def run_benchmark(runs: int = 30):
     """Run the full benchmark suite."""
     # Create output directories
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
     # Results storage: {input_file: {(mu, lambda, gens): [(fitness, time), ...]}}
     all_results = {f: defaultdict(list) for f in INPUT_FILES}
@@ -81,60 +96,59 @@ def run_benchmark(runs: int = 30):
     print(f"=" * 60)
     print()
 
-    for input_file in INPUT_FILES:
-        input_name = input_file.replace(".txt", "")
-        input_dir = OUTPUT_DIR / input_name
-        input_dir.mkdir(parents=True, exist_ok=True)
-
-        print(f"\n{'='*60}")
-        print(f"INPUT: {input_file}")
-        print(f"{'='*60}")
-
-        results = all_results[input_file]
-        best_gifs = all_best_gifs[input_file]
-
-        for gens in GENERATION_VALUES:
-            for mu in MU_VALUES:
-                for lambda_ in LAMBDA_VALUES:
-                    config_key = (mu, lambda_, gens)
-                    config_name = f"mu{mu}_lambda{lambda_}_gen{gens}"
-
-                    print(f"\n[{input_name}/{config_name}]")
-
-                    best_fitness = 0
-                    best_path = None
-
-                    for run_idx in range(runs):
-                        current_run += 1
-                        temp_path = TEMP_DIR / f"{input_name}_{config_name}_run{run_idx}.gif"
-
-                        fitness, elapsed = run_single(input_file, mu, lambda_, gens, temp_path)
-                        results[config_key].append((fitness, elapsed))
-
-                        # Track best
-                        if fitness > best_fitness:
-                            best_fitness = fitness
-                            if best_path and best_path.exists():
-                                best_path.unlink()
-                            best_path = temp_path
-                        else:
-                            # Remove non-best GIF to save space
-                            if temp_path.exists():
-                                temp_path.unlink()
-
-                        fitnesses = [r[0] for r in results[config_key]]
-                        avg_so_far = sum(fitnesses) / len(fitnesses)
-                        print(f"  Run {run_idx + 1}/{runs}: {fitness:.0f} in {elapsed:.1f}s (best: {best_fitness:.0f}, avg: {avg_so_far:.1f}) [{current_run}/{total_runs}]")
-
-                    # Save best GIF to output directory
-                    if best_path and best_path.exists():
-                        final_path = input_dir / f"{config_name}.gif"
-                        shutil.move(str(best_path), str(final_path))
-                        best_gifs[config_key] = (best_fitness, final_path)
-                        print(f"  -> Saved best ({best_fitness:.0f}) to {final_path}")
-
-    # Clean up temp directory
-    shutil.rmtree(TEMP_DIR, ignore_errors=True)
+    # One pool for the whole sweep, so each worker imports the EA only once
+    with ProcessPoolExecutor() as pool:
+        for input_file in INPUT_FILES:
+            input_name = input_file.replace(".txt", "")
+            input_dir = OUTPUT_DIR / input_name
+            input_dir.mkdir(parents=True, exist_ok=True)
+
+            print(f"\n{'='*60}")
+            print(f"INPUT: {input_file}")
+            print(f"{'='*60}")
+
+            results = all_results[input_file]
+            best_gifs = all_best_gifs[input_file]
+
+            for gens in GENERATION_VALUES:
+                for mu in MU_VALUES:
+                    for lambda_ in LAMBDA_VALUES:
+                        config_key = (mu, lambda_, gens)
+                        config_name = f"mu{mu}_lambda{lambda_}_gen{gens}"
+
+                        print(f"\n[{input_name}/{config_name}]")
+
+                        best_fitness = 0
+                        best_seed = None
+
+                        seeds = [random.randrange(2**31) for _ in range(runs)]
+                        trials = pool.map(
+                            run_trial,
+                            [input_file] * runs,
+                            [mu] * runs,
+                            [lambda_] * runs,
+                            [gens] * runs,
+                            seeds,
+                        )
+                        for run_idx, (seed, (fitness, elapsed)) in enumerate(zip(seeds, trials)):
+                            current_run += 1
+                            results[config_key].append((fitness, elapsed))
+
+                            # Track best
+                            if fitness > best_fitness:
+                                best_fitness = fitness
+                                best_seed = seed
+
+                            fitnesses = [r[0] for r in results[config_key]]
+                            avg_so_far = sum(fitnesses) / len(fitnesses)
+                            print(f"  Run {run_idx + 1}/{runs}: {fitness:.0f} in {elapsed:.1f}s (best: {best_fitness:.0f}, avg: {avg_so_far:.1f}) [{current_run}/{total_runs}]")
+
+                        # Replay the best run to save its GIF
+                        if best_seed is not None:
+                            final_path = input_dir / f"{config_name}.gif"
+                            save_gif(input_file, mu, lambda_, gens, best_seed, final_path)
+                            best_gifs[config_key] = (best_fitness, final_path)
+                            print(f"  -> Saved best ({best_fitness:.0f}) to {final_path}")
 
     # Generate markdown tables
     print("\n" + "=" * 60)
@@ -1,7 +1,8 @@
 """Board state and placement management for shape packer.
 
 This module handles the board representation and collision detection
-for placing shapes. Uses numpy array for fast collision detection.
+for placing shapes. Each board row is stored as an integer bitset, so
+collision checks and updates work on a whole shape row at a time.
 
 Example:
     board = Board(width=20, height=50)
@@ -12,111 +13,373 @@ Example:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import FrozenSet, Set
+from typing import TYPE_CHECKING
 
-import numpy as np
+from shape_packer.shape import Point
 
-from shape_packer.shape import Point, Shape
+if TYPE_CHECKING:
+    from typing import FrozenSet, Iterable, List, Tuple
+
+    from shape_packer.shape import Shape
+
+
+# Placement keys pack (shape_id, rotation, row, col) into one int. Coordinates
+# are offset into a 20-bit field, so any position within +/-2**19 of the
+# origin gets a distinct key.
+_KEY_COORD_OFFSET = 1 << 19
+_KEY_COORD_BITS = 20
 
 
 class Placement:
-    """A shape placed on the board at a specific position and rotation."""
+    """A shape placed on the board at a specific position and rotation.
+
+    Attributes:
+        shape: Shape being placed.
+        rotation: Rotation index (0-3).
+        row: Row of the shape origin.
+        col: Column of the shape origin.
+        max_col: Rightmost column the shape occupies.
+    """
 
-    __slots__ = ('shape', 'position', 'rotation', '_points')
+    __slots__ = (
+        'shape', 'rotation', 'row', 'col', '_position',
+        '_row_start', '_row_end', '_col_shift', '_col_end', '_row_masks',
+        '_key', '_points', 'max_col',
+    )
 
     def __init__(self, shape: Shape, position: Point, rotation: int) -> None:
+        self._setup(shape, position.row, position.col, rotation)
+        self._position: Point | None = position
+
+    @classmethod
+    def at(cls, shape: Shape, row: int, col: int, rotation: int) -> Placement:
+        """Create a placement from raw coordinates.
+
+        Search loops try many candidate positions and reject most of them,
+        so this skips building a Point; ``position`` creates one on first
+        access instead.
+
+        Args:
+            shape: Shape to place.
+            row: Row of the shape origin.
+            col: Column of the shape origin.
+            rotation: Rotation index (0-3).
+
+        Returns:
+            New Placement.
+        """
+        placement = cls.__new__(cls)
+        placement._setup(shape, row, col, rotation)
+        placement._position = None
+        return placement
+
+    def _setup(self, shape: Shape, row: int, col: int, rotation: int) -> None:
+        """Initialize everything except the cached position Point."""
         self.shape = shape
-        self.position = position
         self.rotation = rotation
-        # Cache points on creation
-        self._points = shape.get_points_at(position, rotation)
+        # Origin as plain ints; hot loops read these instead of building
+        # the position Point
+        self.row = row
+        self.col = col
+        # Row bitmasks are shared per rotation; only the extents are per
+        # placement, resolved here so Board never has to look up bounds
+        min_r, end_r, min_c, end_c, self._row_masks = shape.get_layout(rotation)
+        self._row_start = row + min_r
+        self._row_end = row + end_r
+        self._col_shift = col + min_c
+        self._col_end = col + end_c
+        # Rightmost occupied column, read for every placement whenever an
+        # individual's fitness is computed
+        self.max_col = self._col_end - 1
+        self._key: int | None = None
+        self._points: FrozenSet[Point] | None = None
+
+    @property
+    def position(self) -> Point:
+        """Get the position of the shape origin (built on first use)."""
+        if self._position is None:
+            self._position = Point(self.row, self.col)
+        return self._position
+
+    @property
+    def rows(self) -> Tuple[int, ...]:
+        """Get the row of each occupied cell, parallel to ``cols``."""
+        offset = self.row
+        return tuple(r + offset for r in self.shape.get_coords(self.rotation)[0])
+
+    @property
+    def cols(self) -> Tuple[int, ...]:
+        """Get the column of each occupied cell, parallel to ``rows``."""
+        offset = self.col
+        return tuple(c + offset for c in self.shape.get_coords(self.rotation)[1])
 
     @property
     def points(self) -> FrozenSet[Point]:
-        """Get all points occupied by this placement (cached)."""
+        """Get all points occupied by this placement (cached on first use)."""
+        if self._points is None:
+            self._points = frozenset(map(Point, self.rows, self.cols))
         return self._points
 
+    @property
+    def key(self) -> int:
+        """Get (shape_id, rotation, row, col) packed into one int (cached).
+
+        Most placements are throwaway candidates that are never hashed, so
+        the key is built on first use rather than in __init__.
+        """
+        if self._key is None:
+            self._key = (
+                (self.shape.shape_id << 2 | self.rotation) << (2 * _KEY_COORD_BITS)
+                | (self.row + _KEY_COORD_OFFSET) << _KEY_COORD_BITS
+                | (self.col + _KEY_COORD_OFFSET)
+            )
+        return self._key
+
+    def __reduce__(self):
+        # Derived extents and caches are rebuilt from the shape on load
+        return (Placement.at, (self.shape, self.row, self.col, self.rotation))
+
     def __hash__(self) -> int:
-        return hash((self.shape.shape_id, self.position, self.rotation))
+        return self.key
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Placement):
             return NotImplemented
-        return (self.shape.shape_id == other.shape.shape_id and
-                self.position == other.position and
-                self.rotation == other.rotation)
+        return self.key == other.key
 
 
 class Board:
     """A rectangular board for placing shapes.
 
-    Uses numpy boolean array for fast collision detection.
+    Each row is an integer bitset (bit ``c`` set means column ``c`` is
+    occupied), so a placement is checked and applied one shape row at a
+    time instead of one cell at a time.
 
     Attributes:
         width: Board width (number of columns).
         height: Board height (number of rows).
     """
 
-    __slots__ = ('width', 'height', '_grid')
+    __slots__ = ('width', 'height', '_rows', '_columns', '_occupied')
 
     def __init__(self, width: int, height: int) -> None:
         """Create an empty board."""
         self.width = width
         self.height = height
-        self._grid = np.zeros((height, width), dtype=np.bool_)
+        self._rows: List[int] = [0] * height
+        # Summaries derived from _rows, rebuilt on demand after a change
+        self._columns: int | None = None
+        self._occupied: FrozenSet[Point] | None = None
 
     def can_place(self, placement: Placement) -> bool:
-        """Check if a placement is valid (optimized with numpy)."""
-        shape = placement.shape
-        pos = placement.position
-        min_r, max_r, min_c, max_c = shape.get_bounds(placement.rotation)
+        """Check if a placement is valid (one bitwise test per shape row)."""
+        row = placement._row_start
+        shift = placement._col_shift
 
         # Fast bounds check
-        if (pos.row + min_r < 0 or pos.row + max_r >= self.height or
-            pos.col + min_c < 0 or pos.col + max_c >= self.width):
+        if (row < 0 or placement._row_end > self.height or
+            shift < 0 or placement._col_end > self.width):
+            return False
+
+        rows = self._rows
+        for mask in placement._row_masks:
+            if rows[row] & (mask << shift):
+                return False
+            row += 1
+        return True
+
+    def fits(self, shape: Shape, rotation: int, row: int, col: int) -> bool:
+        """Check an origin the way ``can_place`` would, without a Placement.
+
+        Sampling loops reject most candidates, so they test raw coordinates
+        here and only build a Placement for the one that fits. The shape's
+        bounding box is checked against the board before any row is read.
+
+        Args:
+            shape: Shape to fit.
+            rotation: Rotation index (0-3).
+            row: Row of the shape origin.
+            col: Column of the shape origin.
+
+        Returns:
+            True if the shape fits there.
+        """
+        min_r, end_r, min_c, end_c, masks = shape.get_layout(rotation)
+        row += min_r
+        shift = col + min_c
+        if (row < 0 or row - min_r + end_r > self.height or
+            shift < 0 or col + end_c > self.width):
             return False
 
-        # Check collision using numpy array lookup
-        for point in placement.points:
-            if self._grid[point.row, point.col]:
+        rows = self._rows
+        for mask in masks:
+            if rows[row] & (mask << shift):
                 return False
+            row += 1
         return True
 
+    def leftmost_fit(
+        self, shape: Shape, rotation: int, end_col: int
+    ) -> Tuple[int, int] | None:
+        """Find the first free spot for a shape, scanning columns then rows.
+
+        Equivalent to trying ``can_place`` for every origin with column
+        below ``end_col``, column by column and top to bottom. Instead of
+        testing origins one at a time, each candidate row is resolved for
+        all columns at once: shifting a board row right by the offset of
+        every shape cell on it and OR-ing the results marks each column
+        where the shape would hit something.
+
+        Args:
+            shape: Shape to fit.
+            rotation: Rotation index (0-3).
+            end_col: Exclusive upper bound on the origin column.
+
+        Returns:
+            (row, col) of the shape origin, or None if nothing fits.
+        """
+        min_r, end_r, min_c, end_c, _ = shape.get_layout(rotation)
+        row_bits = shape.get_row_bits(rotation)
+        rows = self._rows
+        # Board rows covered by the first mask, and origin columns, for
+        # which the whole shape stays inside the board
+        top_start = max(min_r, 0)
+        top_stop = self.height - (end_r - min_r) + 1
+        col_start = max(-min_c, 0)
+        col_stop = min(end_col, self.width - end_c + 1)
+        if col_start >= col_stop:
+            return None
+
+        # Bit s stands for the placement whose leftmost cell is in column s
+        allowed = ((1 << (col_stop - col_start)) - 1) << (col_start + min_c)
+        best_top = -1
+        best_bit = 0
+        for top in range(top_start, top_stop):
+            blocked = 0
+            row = top
+            for offsets in row_bits:
+                bits = rows[row]
+                if bits:
+                    for offset in offsets:
+                        blocked |= bits >> offset
+                row += 1
+            free = allowed & ~blocked
+            if free:
+                # Lower rows only matter if they fit further left
+                best_bit = free & -free
+                best_top = top
+                allowed = best_bit - 1 & allowed
+                if not allowed:
+                    break
+        if best_top < 0:
+            return None
+        return best_top - min_r, best_bit.bit_length() - 1 - min_c
+
     def place(self, placement: Placement) -> None:
         """Place a shape on the board."""
-        for point in placement.points:
-            self._grid[point.row, point.col] = True
+        self._columns = self._occupied = None
+        rows = self._rows
+        row = placement._row_start
+        shift = placement._col_shift
+        for mask in placement._row_masks:
+            rows[row] |= mask << shift
+            row += 1
+
+    def place_all(self, placements: Iterable[Placement]) -> bool:
+        """Place several shapes at once if none of them collide.
+
+        All placements are OR-ed into a scratch copy of the rows, checking
+        each shape row against what is already there, and the result is
+        committed in one step.
+
+        Args:
+            placements: Placements to add.
+
+        Returns:
+            True if every placement fit; False leaves the board unchanged.
+        """
+        rows = list(self._rows)
+        height = self.height
+        width = self.width
+        for placement in placements:
+            row = placement._row_start
+            shift = placement._col_shift
+            if (row < 0 or placement._row_end > height or
+                shift < 0 or placement._col_end > width):
+                return False
+            for mask in placement._row_masks:
+                bits = mask << shift
+                if rows[row] & bits:
+                    return False
+                rows[row] |= bits
+                row += 1
+        self._rows = rows
+        self._columns = self._occupied = None
+        return True
 
     def remove(self, placement: Placement) -> None:
         """Remove a shape from the board."""
-        for point in placement.points:
-            self._grid[point.row, point.col] = False
+        self._columns = self._occupied = None
+        rows = self._rows
+        row = placement._row_start
+        shift = placement._col_shift
+        for mask in placement._row_masks:
+            rows[row] &= ~(mask << shift)
+            row += 1
 
     def is_occupied(self, point: Point) -> bool:
         """Check if a point is occupied."""
-        return self._grid[point.row, point.col]
+        return bool(self._rows[point.row] >> point.col & 1)
+
+    @property
+    def column_occupancy(self) -> int:
+        """Get a bitmask of the columns holding at least one cell (cached)."""
+        if self._columns is None:
+            columns = 0
+            for bits in self._rows:
+                columns |= bits
+            self._columns = columns
+        return self._columns
 
     @property
     def rightmost_column(self) -> int:
-        """Get the rightmost occupied column."""
-        cols = np.any(self._grid, axis=0)
-        if not np.any(cols):
-            return -1
-        return int(np.max(np.where(cols)))
+        """Get the rightmost occupied column.
+
+        The widest row bitset holds the highest set bit, so a C-level
+        ``max`` finds it without OR-ing every row together.
+        """
+        if self._columns is not None:
+            return self._columns.bit_length() - 1
+        return max(self._rows, default=0).bit_length() - 1
 
     @property
     def occupied_points(self) -> FrozenSet[Point]:
-        """Get all occupied points."""
-        rows, cols = np.where(self._grid)
-        return frozenset(Point(int(r), int(c)) for r, c in zip(rows, cols))
+        """Get all occupied points (cached until the board changes)."""
+        if self._occupied is None:
+            points = []
+            for row, bits in enumerate(self._rows):
+                while bits:
+                    low = bits & -bits
+                    points.append(Point(row, low.bit_length() - 1))
+                    bits ^= low
+            self._occupied = frozenset(points)
+        return self._occupied
 
     def clear(self) -> None:
         """Remove all placements from the board."""
-        self._grid.fill(False)
+        self._rows = [0] * self.height
+        self._columns = self._occupied = None
 
     def copy(self) -> Board:
-        """Create a copy of this board."""
-        new_board = Board(self.width, self.height)
-        new_board._grid = self._grid.copy()
+        """Create a copy of this board.
+
+        Bypasses __init__ so the empty row list is never built, and hands
+        over the cached summaries, which are immutable and still valid.
+        """
+        new_board = Board.__new__(Board)
+        new_board.width = self.width
+        new_board.height = self.height
+        new_board._rows = self._rows[:]
+        new_board._columns = self._columns
+        new_board._occupied = self._occupied
         return new_board
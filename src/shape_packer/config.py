@@ -31,6 +31,14 @@ class ShapePackerConfig:
             termination.
         max_placement_attempts: Maximum random attempts to place a shape.
         seed: Random seed for reproducibility. None for random seed.
+        workers: Processes used to create offspring. 1 creates them in
+            the calling process.
+        islands: Number of sub-populations evolved independently between
+            migrations. 1 evolves a single population.
+        migration_interval: Generations each island runs between
+            migrations.
+        migrants: Best individuals each island sends to the next one, in
+            a ring, at every migration.
     """
 
     mu: int = 100
@@ -41,6 +49,10 @@ class ShapePackerConfig:
     stagnation_generations: int = 250
     max_placement_attempts: int = 255
     seed: Optional[int] = None
+    workers: int = 1
+    islands: int = 1
+    migration_interval: int = 10
+    migrants: int = 1
 
     def __post_init__(self) -> None:
         """Validate configuration values.
@@ -74,3 +86,16 @@ class ShapePackerConfig:
                 f"max_placement_attempts must be >= 1, "
                 f"got {self.max_placement_attempts}"
             )
+        if self.workers < 1:
+            raise ValueError(f"workers must be >= 1, got {self.workers}")
+        if not 1 <= self.islands <= self.mu:
+            raise ValueError(
+                f"islands must be in [1, mu], got {self.islands}"
+            )
+        if self.migration_interval < 1:
+            raise ValueError(
+                f"migration_interval must be >= 1, "
+                f"got {self.migration_interval}"
+            )
+        if self.migrants < 0:
+            raise ValueError(f"migrants must be >= 0, got {self.migrants}")
@@ -26,14 +26,17 @@ Example:
 
 from __future__ import annotations
 
+import dataclasses
+import heapq
 import random
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from sat_solver import termination
 
 TerminationCondition = termination.TerminationCondition
 TerminationManager = termination.TerminationManager
 
+from shape_packer.board import Placement
 from shape_packer.config import ShapePackerConfig
 from shape_packer.individual import Individual
 from shape_packer.operators import (
@@ -43,7 +46,7 @@ from shape_packer.operators import (
     RandomReplaceMutation,
     UniformCrossover,
 )
-from shape_packer.population import Population
+from shape_packer.population import Population, init_random_worker
 from shape_packer.selection import (
     SelectionStrategy,
     TournamentSelection,
@@ -51,6 +54,164 @@ from shape_packer.selection import (
 )
 from shape_packer.shape import Shape
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# An individual as plain picklable data: one (shape_id, row, col, rotation)
+# tuple per placement, in placement order
+Genome = List[Tuple[int, int, int, int]]
+
+
+def _breed(
+    parent1: Individual,
+    parent2: Individual,
+    board_dims: Tuple[int, int],
+    config: ShapePackerConfig,
+    crossover: CrossoverOperator,
+    mutation: MutationOperator,
+    local_search: MutationOperator,
+) -> Individual:
+    """Create one child by crossover, then maybe mutation and local search."""
+    child = crossover.crossover(parent1, parent2, board_dims, config)
+
+    # Mutation (probabilistic)
+    if random.random() < config.mutation_rate:
+        child = mutation.mutate(child, board_dims, config)
+
+    # Apply local search occasionally (5% of the time)
+    if random.random() < 0.05:
+        child = local_search.mutate(child, board_dims, config)
+
+    return child
+
+
+def _to_genome(individual: Individual) -> Genome:
+    """Flatten an individual for sending to another process."""
+    return [
+        (p.shape.shape_id, p.row, p.col, p.rotation)
+        for p in individual.placements
+    ]
+
+
+def _from_genome(
+    genome: Genome,
+    shapes_by_id: Dict[int, Shape],
+    board_dims: Tuple[int, int],
+) -> Individual:
+    """Rebuild an individual from its genome and the shared shapes."""
+    placements = [
+        Placement.at(shapes_by_id[shape_id], row, col, rotation)
+        for shape_id, row, col, rotation in genome
+    ]
+    return Individual(placements, board_dims[0], board_dims[1])
+
+
+# Everything an offspring worker needs besides the parents. It is sent once
+# per process by the pool initializer rather than with every task.
+_worker_state: tuple | None = None
+
+
+def _init_offspring_worker(
+    shapes: List[Shape],
+    board_dims: Tuple[int, int],
+    config: ShapePackerConfig,
+    crossover: CrossoverOperator,
+    mutation: MutationOperator,
+    local_search: MutationOperator,
+) -> None:
+    """Store the run's shapes and operators in a worker process."""
+    global _worker_state
+    init_random_worker(shapes, board_dims, config)
+    shapes_by_id = {shape.shape_id: shape for shape in shapes}
+    _worker_state = (
+        shapes_by_id, board_dims, config, crossover, mutation, local_search,
+    )
+
+
+def _make_offspring(job: Tuple[int, Genome, Genome]) -> Genome:
+    """Breed one child in a worker process.
+
+    Args:
+        job: Tuple of (seed, parent1 genome, parent2 genome). The seed
+            makes the child depend only on the job, not on which worker
+            runs it.
+
+    Returns:
+        Genome of the child.
+    """
+    seed, genome1, genome2 = job
+    shapes_by_id, board_dims, config, crossover, mutation, local_search = (
+        _worker_state
+    )
+    random.seed(seed)
+    child = _breed(
+        _from_genome(genome1, shapes_by_id, board_dims),
+        _from_genome(genome2, shapes_by_id, board_dims),
+        board_dims,
+        config,
+        crossover,
+        mutation,
+        local_search,
+    )
+    return _to_genome(child)
+
+
+def _run_island(
+    island_ea: ShapePackerEA,
+    population: Population,
+    generations: int,
+) -> Population:
+    """Evolve one island for a number of generations.
+
+    Args:
+        island_ea: Single-population EA holding the run's operators.
+        population: Island population to start from.
+        generations: Generations to run.
+
+    Returns:
+        The island population after the last generation.
+    """
+    island_ea.config = dataclasses.replace(
+        island_ea.config, mu=len(population)
+    )
+    island_ea._population = population
+    for _ in range(generations):
+        island_ea._evolve_one_generation()
+    return island_ea._population
+
+
+# Island EA of a worker process, built once by the pool initializer
+_island_ea: ShapePackerEA | None = None
+
+
+def _init_island_worker(island_ea: ShapePackerEA) -> None:
+    """Store the single-population EA that runs islands in a worker."""
+    global _island_ea
+    init_random_worker(
+        island_ea.shapes, island_ea.board_dims, island_ea.config
+    )
+    _island_ea = island_ea
+
+
+def _evolve_island(job: Tuple[int, List[Genome], int]) -> List[Genome]:
+    """Evolve one island in a worker process.
+
+    Args:
+        job: Tuple of (seed, genomes of the island, generations).
+
+    Returns:
+        Genomes of the island after the last generation.
+    """
+    seed, genomes, generations = job
+    ea = _island_ea
+    random.seed(seed)
+    population = Population([
+        _from_genome(genome, ea._shapes_by_id, ea.board_dims)
+        for genome in genomes
+    ])
+    population = _run_island(ea, population, generations)
+    return [_to_genome(ind) for ind in population.individuals]
+
 
 class ShapePackerEA:
     """Evolutionary algorithm for shape packing.
@@ -76,6 +237,7 @@ class ShapePackerEA:
         survival_selection: SelectionStrategy | None = None,
         crossover: CrossoverOperator | None = None,
         mutation: MutationOperator | None = None,
+        local_search: MutationOperator | None = None,
     ) -> None:
         """Create a shape packer EA.
 
@@ -89,6 +251,12 @@ class ShapePackerEA:
                 to TruncationSelection.
             crossover: Crossover operator. Defaults to UniformCrossover.
             mutation: Mutation operator. Defaults to RandomReplaceMutation.
+            local_search: Operator occasionally applied after mutation.
+                Defaults to LocalSearchMutation.
+
+        With ``config.workers`` above 1, the initial population and the
+        offspring (or islands) are built in worker processes, so custom
+        operators must be picklable.
         """
         self.shapes = shapes
         self.board_dims = board_dims
@@ -105,11 +273,19 @@ class ShapePackerEA:
         self._survival_selection = survival_selection or TruncationSelection()
         self._crossover = crossover or UniformCrossover()
         self._mutation = mutation or RandomReplaceMutation()
+        self._local_search = local_search or LocalSearchMutation()
 
         # State
         self._population: Population | None = None
         self._generation = 0
         self._best_ever: Individual | None = None
+        # Parents + offspring pool, refilled in place every generation.
+        # Selection strategies build new lists, so nothing keeps a
+        # reference to it between generations.
+        self._combined: List[Individual] = []
+        # Offspring worker pool, only running inside search()
+        self._pool: ProcessPoolExecutor | None = None
+        self._shapes_by_id = {shape.shape_id: shape for shape in shapes}
 
     def search(
         self,
@@ -123,33 +299,180 @@ class ShapePackerEA:
         Returns:
             Best individual found.
         """
-        # Initialize population
-        self._population = Population.random(
+        islands = self.config.islands > 1
+        island_ea = self._make_island_ea() if islands else None
+        if self.config.workers > 1:
+            # Imported here: the multiprocessing machinery is only needed
+            # for parallel runs and is slow to import
+            from concurrent.futures import ProcessPoolExecutor
+
+            if islands:
+                initializer = _init_island_worker
+                initargs = (island_ea,)
+            else:
+                initializer = _init_offspring_worker
+                initargs = (
+                    self.shapes,
+                    self.board_dims,
+                    self.config,
+                    self._crossover,
+                    self._mutation,
+                    self._local_search,
+                )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.config.workers,
+                initializer=initializer,
+                initargs=initargs,
+            )
+
+        try:
+            # Initialize population, on the workers if there are any
+            self._population = Population.random(
+                self.shapes,
+                self.board_dims,
+                self.config,
+                self.config.mu,
+                executor=self._pool,
+            )
+            self._best_ever = self._population.fittest
+            self._generation = 0
+
+            # Set up termination manager
+            term_manager = TerminationManager(
+                termination_conditions,
+                lambda: self._population.fitnesses,
+            )
+
+            # Main loop
+            if islands:
+                self._search_islands(term_manager, island_ea)
+                return self._best_ever
+            while not term_manager.should_terminate():
+                self._generation += 1
+                self._evolve_one_generation()
+
+                # Track best ever
+                current_best = self._population.fittest
+                if current_best.fitness > self._best_ever.fitness:
+                    self._best_ever = current_best
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+        return self._best_ever
+
+    def _make_island_ea(self) -> ShapePackerEA:
+        """Build the single-population EA that evolves each island."""
+        islands = self.config.islands
+        config = dataclasses.replace(
+            self.config,
+            mu=self.config.mu // islands,
+            # Every island still breeds at least one pair
+            lambda_=max(2, -(-self.config.lambda_ // islands)),
+            seed=None,
+            workers=1,
+            islands=1,
+        )
+        return ShapePackerEA(
             self.shapes,
             self.board_dims,
-            self.config,
-            self.config.mu,
+            config,
+            parent_selection=self._parent_selection,
+            survival_selection=self._survival_selection,
+            crossover=self._crossover,
+            mutation=self._mutation,
+            local_search=self._local_search,
         )
-        self._best_ever = self._population.fittest
-        self._generation = 0
 
-        # Set up termination manager
-        term_manager = TerminationManager(
-            termination_conditions,
-            lambda: self._population.fitnesses,
-        )
+    def _search_islands(
+        self,
+        term_manager: TerminationManager,
+        island_ea: ShapePackerEA,
+    ) -> None:
+        """Evolve the population as islands until termination.
+
+        The population is dealt into ``config.islands`` sub-populations.
+        Each runs ``config.migration_interval`` generations on its own,
+        in a worker process when there is a pool, after which every
+        island sends its best ``config.migrants`` individuals to the next
+        one in a ring, replacing that island's worst. Termination is
+        checked against the merged population once for every generation
+        the islands ran.
+
+        Args:
+            term_manager: Termination manager of the run.
+            island_ea: Single-population EA that evolves each island.
+        """
+        interval = self.config.migration_interval
+        islands = self._population.split(self.config.islands)
 
-        # Main loop
         while not term_manager.should_terminate():
-            self._generation += 1
-            self._evolve_one_generation()
+            # Every island gets its own seed from the main stream, so a
+            # seeded run ends the same however many workers there are
+            seeds = [random.getrandbits(64) for _ in islands]
+            if self._pool is None:
+                state = random.getstate()
+                evolved = []
+                for seed, island in zip(seeds, islands):
+                    random.seed(seed)
+                    evolved.append(_run_island(island_ea, island, interval))
+                random.setstate(state)
+                islands = evolved
+            else:
+                jobs = [
+                    (seed, [_to_genome(ind) for ind in island], interval)
+                    for seed, island in zip(seeds, islands)
+                ]
+                islands = [
+                    Population([
+                        _from_genome(genome, self._shapes_by_id, self.board_dims)
+                        for genome in genomes
+                    ])
+                    for genomes in self._pool.map(_evolve_island, jobs)
+                ]
+
+            islands = self._migrate(islands)
+            self._population = Population.merge(islands)
+            self._generation += interval
 
-            # Track best ever
             current_best = self._population.fittest
             if current_best.fitness > self._best_ever.fitness:
                 self._best_ever = current_best
 
-        return self._best_ever
+            # The loop condition accounts for one generation of the epoch
+            if any(
+                term_manager.should_terminate() for _ in range(interval - 1)
+            ):
+                break
+
+    def _migrate(self, islands: List[Population]) -> List[Population]:
+        """Send each island's best individuals to the next island.
+
+        Args:
+            islands: Island populations.
+
+        Returns:
+            Island populations after migration.
+        """
+        emigrants = [
+            heapq.nlargest(
+                min(self.config.migrants, len(island) - 1),
+                island.individuals,
+                key=lambda ind: ind.fitness,
+            )
+            for island in islands
+        ]
+        migrated = []
+        for i, island in enumerate(islands):
+            incoming = emigrants[i - 1]
+            kept = heapq.nlargest(
+                len(island) - len(incoming),
+                island.individuals,
+                key=lambda ind: ind.fitness,
+            )
+            migrated.append(Population(kept + incoming))
+        return migrated
 
     def _evolve_one_generation(self) -> None:
         """Perform one generation of evolution with elitism."""
@@ -163,38 +486,59 @@ class ShapePackerEA:
         )
 
         # Create offspring
-        offspring: List[Individual] = []
-        local_search = LocalSearchMutation()
-
-        for i in range(0, len(parents) - 1, 2):
-            parent1 = parents[i]
-            parent2 = parents[i + 1] if i + 1 < len(parents) else parents[0]
-
-            # Crossover
-            child = self._crossover.crossover(
-                parent1, parent2, self.board_dims, self.config
-            )
-
-            # Mutation (probabilistic)
-            if random.random() < self.config.mutation_rate:
-                child = self._mutation.mutate(child, self.board_dims, self.config)
-
-            # Apply local search occasionally (5% of the time)
-            if random.random() < 0.05:
-                child = local_search.mutate(child, self.board_dims, self.config)
-
-            offspring.append(child)
-
-        # Combine with elitism: include elite in combined pool
-        combined = self._population.individuals + offspring
-        if elite not in combined:
-            combined.append(elite)
-
-        # Select survivors
+        pairs = [
+            (parents[i], parents[i + 1] if i + 1 < len(parents) else parents[0])
+            for i in range(0, len(parents) - 1, 2)
+        ]
+        if self._pool is None:
+            offspring = [
+                _breed(
+                    parent1,
+                    parent2,
+                    self.board_dims,
+                    self.config,
+                    self._crossover,
+                    self._mutation,
+                    self._local_search,
+                )
+                for parent1, parent2 in pairs
+            ]
+        else:
+            # Every child gets its own seed from the main stream, so a
+            # seeded run ends the same for any number of workers above
+            # one; the serial path breeds straight from the main stream
+            jobs = [
+                (random.getrandbits(64), _to_genome(parent1), _to_genome(parent2))
+                for parent1, parent2 in pairs
+            ]
+            chunksize = max(1, len(jobs) // (4 * self.config.workers))
+            offspring = [
+                _from_genome(genome, self._shapes_by_id, self.board_dims)
+                for genome in self._pool.map(
+                    _make_offspring, jobs, chunksize=chunksize
+                )
+            ]
+
+        # Combine parents and offspring; the elite is one of the parents,
+        # so it is already in the pool
+        combined = self._combined
+        combined[:] = self._population.individuals
+        combined += offspring
+
+        # Select survivors; a pool that already fits keeps everyone, elite
+        # included, without running the strategy
+        if len(combined) <= self.config.mu:
+            self._population = Population(list(combined))
+            return
         survivors = self._survival_selection.select(combined, self.config.mu)
 
-        # Ensure elite survives (elitism guarantee)
-        if elite not in survivors:
+        # Ensure elite survives (elitism guarantee). Checked by identity:
+        # equality would compare fitness and placements element by element.
+        # Truncation puts it first unless an offspring beat it, so that
+        # slot is tried before scanning.
+        if survivors[0] is not elite and not any(
+            ind is elite for ind in survivors
+        ):
             survivors[-1] = elite
 
         self._population = Population(survivors)
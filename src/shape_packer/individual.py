@@ -12,12 +12,15 @@ Example:
 
 from __future__ import annotations
 
+import operator
 import random
 from typing import List, Optional, Tuple
 
 from shape_packer.board import Board, Placement
 from shape_packer.config import ShapePackerConfig
-from shape_packer.shape import Point, Shape
+from shape_packer.shape import Shape
+
+_max_col = operator.attrgetter("max_col")
 
 
 class Individual:
@@ -36,45 +39,43 @@ class Individual:
         fitness: Cached fitness value (higher is better).
     """
 
+    __slots__ = (
+        "placements", "board_width", "board_height", "fitness", "_signature",
+        "_by_shape",
+    )
+
     def __init__(
         self,
         placements: List[Placement],
         board_width: int,
         board_height: int,
+        fitness: Optional[float] = None,
     ) -> None:
         """Create an individual from placements.
 
+        Fitness = board_width - rightmost_occupied_column, so higher
+        fitness means more empty space on the left. Every individual is
+        compared and sorted right away, so it is computed here and stored
+        as a plain attribute.
+
         Args:
             placements: List of shape placements.
             board_width: Width of the board.
             board_height: Height of the board.
+            fitness: Known fitness of these placements, e.g. when an
+                operator hands back an unchanged genome. Computed if None.
         """
         self.placements = placements
         self.board_width = board_width
         self.board_height = board_height
-        self._fitness: Optional[float] = None
-
-    @property
-    def fitness(self) -> float:
-        """Get the fitness value (cached).
-
-        Fitness = board_width - rightmost_occupied_column.
-        Higher fitness means more empty space on the left.
-
-        Returns:
-            Fitness value.
-        """
-        if self._fitness is None:
-            if not self.placements:
-                self._fitness = float(self.board_width)
-            else:
-                rightmost = -1
-                for placement in self.placements:
-                    for point in placement.points:
-                        if point.col > rightmost:
-                            rightmost = point.col
-                self._fitness = float(self.board_width - rightmost - 1)
-        return self._fitness
+        if fitness is None:
+            # Each placement knows its own rightmost column, so this is one
+            # scalar per shape; an empty board scores its full width
+            rightmost = max(map(_max_col, placements), default=-1)
+            fitness = float(board_width - rightmost - 1)
+        self.fitness = fitness
+        self._signature: Optional[Tuple[int, ...]] = None
+        self._by_shape: Optional[Tuple[Placement, ...]] = None
 
     @classmethod
     def random(
@@ -98,21 +99,26 @@ class Individual:
         """
         width, height = board_dims
         board = Board(width, height)
-        placements: List[Placement] = []
-
-        # Shuffle shapes randomly
         shapes_to_place = list(shapes)
-        random.shuffle(shapes_to_place)
 
-        for shape in shapes_to_place:
-            placement = cls._try_place_shape_random(shape, board, config)
-            if placement is None:
-                # Restart with different order
-                return cls.random(shapes, board_dims, config)
-            placements.append(placement)
-            board.place(placement)
+        while True:
+            placements: List[Placement] = []
 
-        return cls(placements, width, height)
+            # Shuffle shapes randomly; a retry reshuffles the same list,
+            # which is just as uniform as shuffling a fresh copy
+            random.shuffle(shapes_to_place)
+
+            for shape in shapes_to_place:
+                placement = cls._try_place_shape_random(shape, board, config)
+                if placement is None:
+                    break
+                placements.append(placement)
+                board.place(placement)
+            else:
+                return cls(placements, width, height)
+
+            # Restart with different order on the same, emptied board
+            board.clear()
 
     @staticmethod
     def _try_place_shape_random(
@@ -132,11 +138,16 @@ class Individual:
         """
         # Limit attempts for speed
         max_attempts = min(config.max_placement_attempts, 150)
+        # One random() call per coordinate; randint goes through several
+        # Python-level calls for every draw
+        rand = random.random
+        height = board.height
+        width = board.width
         for _ in range(max_attempts):
-            rotation = random.randint(0, 3)
-            row = random.randint(0, board.height - 1)
-            col = random.randint(0, board.width - 1)
-            placement = Placement(shape, Point(row, col), rotation)
+            rotation = int(rand() * 4)
+            row = int(rand() * height)
+            col = int(rand() * width)
+            placement = Placement.at(shape, row, col, rotation)
             if board.can_place(placement):
                 return placement
         return None
@@ -147,10 +158,24 @@ class Individual:
         Returns:
             List of shapes sorted by shape_id.
         """
-        return sorted(
-            [p.shape for p in self.placements],
-            key=lambda s: s.shape_id,
-        )
+        return [p.shape for p in self.placements_by_shape]
+
+    @property
+    def placements_by_shape(self) -> Tuple[Placement, ...]:
+        """Get the placements ordered by shape_id (cached).
+
+        Every individual places the same shapes, so these line up
+        position by position across individuals. A fit parent is bred
+        many times per generation and sorts its placements once.
+
+        Returns:
+            Tuple of placements, one per shape_id in increasing order.
+        """
+        if self._by_shape is None:
+            self._by_shape = tuple(
+                sorted(self.placements, key=lambda p: p.shape.shape_id)
+            )
+        return self._by_shape
 
     def __lt__(self, other: Individual) -> bool:
         """Compare by fitness (cached).
@@ -163,26 +188,47 @@ class Individual:
         """
         return self.fitness < other.fitness
 
+    @property
+    def signature(self) -> Tuple[int, ...]:
+        """Get the sorted placement keys that identify this packing (cached).
+
+        Each key packs (shape_id, rotation, row, col), so sorting the keys
+        orders them by shape_id and two individuals share a signature only
+        if every shape sits in the same place.
+
+        Returns:
+            Tuple of placement keys.
+        """
+        if self._signature is None:
+            self._signature = tuple(sorted(p.key for p in self.placements))
+        return self._signature
+
     def __eq__(self, other: object) -> bool:
-        """Check equality by fitness.
+        """Check equality by packing.
+
+        Fitness is compared first as a cheap filter; distinct packings
+        with the same fitness are not equal.
 
         Args:
             other: Other object to compare.
 
         Returns:
-            True if other is Individual with same fitness.
+            True if other is an Individual with the same placements.
         """
         if not isinstance(other, Individual):
             return NotImplemented
-        return self.fitness == other.fitness
+        return (
+            self.fitness == other.fitness
+            and self.signature == other.signature
+        )
 
     def __hash__(self) -> int:
-        """Hash by fitness for set operations.
+        """Hash by packing for set operations.
 
         Returns:
             Hash value.
         """
-        return hash(self.fitness)
+        return hash(self.signature)
 
     def __repr__(self) -> str:
         """Return string representation.
@@ -18,6 +18,8 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 from typing import List, Tuple
 
@@ -47,35 +49,63 @@ def parse_input_file(filepath: Path) -> Tuple[List[Shape], Tuple[int, int]]:
         FileNotFoundError: If file doesn't exist.
         ValueError: If file format is invalid.
     """
-    with open(filepath, "r") as f:
-        lines = f.readlines()
-
-    if not lines:
-        raise ValueError("Input file is empty")
+    # Shapes are immutable, so a parse is reused until the file changes;
+    # only the list is copied in case the caller reorders it
+    stat = os.stat(filepath)
+    shapes, dims = _parse_input_file(
+        os.fspath(filepath), stat.st_mtime_ns, stat.st_size
+    )
+    return list(shapes), dims
 
-    # First line: height [ignored_value]
-    first_line = lines[0].strip().split()
-    if not first_line:
-        raise ValueError(f"First line is empty: {lines[0].strip()}")
 
-    try:
-        height = int(first_line[0])
-    except ValueError as e:
-        raise ValueError(f"Invalid height: {e}") from e
+@functools.lru_cache(maxsize=32)
+def _parse_input_file(
+    filepath: str,
+    mtime_ns: int,
+    size: int,
+) -> Tuple[Tuple[Shape, ...], Tuple[int, int]]:
+    """Parse an input file, memoized on its path, mtime and size.
 
-    # Remaining lines: shape instructions
-    shapes: List[Shape] = []
-    for i, line in enumerate(lines[1:], start=1):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        shape = Shape.from_instructions(line, shape_id=i - 1)
-        shapes.append(shape)
+    Args:
+        filepath: Path to the input file.
+        mtime_ns: Modification time of the file, part of the cache key.
+        size: Size of the file in bytes, part of the cache key.
 
-    # Calculate width as sum of shape bounding boxes (original behavior)
-    width = sum(max(s.bounding_box) for s in shapes)
+    Returns:
+        Tuple of (shapes, (width, height)).
 
-    return shapes, (width, height)
+    Raises:
+        ValueError: If file format is invalid.
+    """
+    # Lines are consumed as they are read rather than loaded up front
+    with open(filepath, "r") as f:
+        header = f.readline()
+        if not header:
+            raise ValueError("Input file is empty")
+
+        # First line: height [ignored_value]
+        first_line = header.split()
+        if not first_line:
+            raise ValueError(f"First line is empty: {header.strip()}")
+
+        try:
+            height = int(first_line[0])
+        except ValueError as e:
+            raise ValueError(f"Invalid height: {e}") from e
+
+        # Remaining lines: shape instructions. Width is the sum of shape
+        # bounding boxes (original behavior), accumulated along the way.
+        shapes: List[Shape] = []
+        width = 0
+        for i, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            shape = Shape.from_instructions(line, shape_id=i - 1)
+            shapes.append(shape)
+            width += shape.max_extent
+
+    return tuple(shapes), (width, height)
 
 
 def write_solution(
@@ -92,23 +122,17 @@ def write_solution(
         solution: Solution to write.
         elapsed_time: Optional elapsed time in seconds.
     """
-    # Sort placements by shape_id
-    sorted_placements = sorted(
-        solution.placements,
-        key=lambda p: p.shape.shape_id,
-    )
-
+    lines = []
+    if elapsed_time is not None:
+        lines.append(f"# Elapsed time: {elapsed_time:.3f}s")
+        lines.append(f"# Fitness: {solution.fitness:.2f}")
+        lines.append("#")
+    for placement in solution.placements_by_shape:
+        lines.append(f"{placement.col},{placement.row},{placement.rotation}")
+
+    # Build the whole file first and hand it over in a single write
     with open(filepath, "w") as f:
-        if elapsed_time is not None:
-            f.write(f"# Elapsed time: {elapsed_time:.3f}s\n")
-            f.write(f"# Fitness: {solution.fitness:.2f}\n")
-            f.write("#\n")
-
-        for placement in sorted_placements:
-            f.write(
-                f"{placement.position.col},{placement.position.row},"
-                f"{placement.rotation}\n"
-            )
+        f.write("".join(line + "\n" for line in lines))
 
 
 def format_solution(solution: Individual) -> str:
@@ -125,14 +149,10 @@ def format_solution(solution: Individual) -> str:
     lines.append("")
     lines.append("Placements (col, row, rotation):")
 
-    sorted_placements = sorted(
-        solution.placements,
-        key=lambda p: p.shape.shape_id,
-    )
-    for placement in sorted_placements:
+    for placement in solution.placements_by_shape:
         lines.append(
             f"  Shape {placement.shape.shape_id}: "
-            f"({placement.position.col}, {placement.position.row}, "
+            f"({placement.col}, {placement.row}, "
             f"rot={placement.rotation})"
         )
 
@@ -12,16 +12,10 @@ import argparse
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from sat_solver.termination import (
-    NoChangeInBestFitness,
-    NumberOfFitnessEvaluations,
-    TerminationCondition,
-)
-
-from shape_packer.config import ShapePackerConfig
-from shape_packer.ea import ShapePackerEA
-from shape_packer.io import format_solution, parse_input_file, write_solution
+if TYPE_CHECKING:
+    from sat_solver.termination import TerminationCondition
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -93,6 +87,18 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Random seed for reproducibility",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to create offspring",
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=1,
+        help="Sub-populations evolved in parallel with periodic migration",
+    )
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -113,6 +119,17 @@ def main(argv: list[str] | None = None) -> int:
     """
     args = parse_args(argv)
 
+    # The EA is imported only once the arguments are valid, so --help and
+    # usage errors return without loading it
+    from sat_solver.termination import (
+        NoChangeInBestFitness,
+        NumberOfFitnessEvaluations,
+    )
+
+    from shape_packer.config import ShapePackerConfig
+    from shape_packer.ea import ShapePackerEA
+    from shape_packer.io import format_solution, parse_input_file, write_solution
+
     # Parse input
     if not args.quiet:
         print(f"Loading shapes from {args.input}...")
@@ -136,6 +153,8 @@ def main(argv: list[str] | None = None) -> int:
         max_evaluations=args.max_evals,
         stagnation_generations=args.stagnation,
         seed=args.seed,
+        workers=args.workers,
+        islands=args.islands,
     )
 
     # Set up termination conditions
@@ -15,12 +15,45 @@ from __future__ import annotations
 import random
 from abc import ABC, abstractmethod
 from math import floor
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 
 from shape_packer.board import Board, Placement
 from shape_packer.config import ShapePackerConfig
 from shape_packer.individual import Individual
-from shape_packer.shape import Point, Shape
+from shape_packer.shape import Shape
+
+# Attempts, each in a fresh random order, before an operator gives up on
+# a genome and falls back to an unchanged parent
+_MAX_RESTARTS = 8
+
+
+def _place_leftmost(shape: Shape, board: Board, end_col: int) -> Placement | None:
+    """Place a shape in the leftmost column where any rotation fits.
+
+    Every rotation's first fit is found exactly with
+    ``Board.leftmost_fit``, top row first within a column. Rotations are
+    tried starting from a random one, which wins ties, so equally good
+    spots are still chosen with some variety.
+
+    Args:
+        shape: Shape to place.
+        board: Current board state.
+        end_col: Exclusive upper bound on the origin column.
+
+    Returns:
+        Placement at the best spot, or None if nothing fits.
+    """
+    start = random.randint(0, 3)
+    best = None
+    for offset in range(4):
+        rotation = (start + offset) % 4
+        spot = board.leftmost_fit(shape, rotation, end_col)
+        if spot is not None:
+            row, end_col = spot
+            best = (row, end_col, rotation)
+    if best is None:
+        return None
+    return Placement.at(shape, *best)
 
 
 class CrossoverOperator(ABC):
@@ -96,23 +129,16 @@ class UniformCrossover(CrossoverOperator):
         Returns:
             New Individual with repaired placements.
         """
-        # Build lookup by shape_id
-        p1_placements: Dict[int, Placement] = {
-            p.shape.shape_id: p for p in parent1.placements
-        }
-        p2_placements: Dict[int, Placement] = {
-            p.shape.shape_id: p for p in parent2.placements
-        }
-
-        # Select placement that is more to the left (with some randomness)
+        # Select placement that is more to the left (with some randomness).
+        # Both parents list their placements by shape_id, so the two
+        # placements of each shape line up.
         selected: List[Placement] = []
-        for shape_id in p1_placements:
-            p1 = p1_placements[shape_id]
-            p2 = p2_placements[shape_id]
-
+        for p1, p2 in zip(
+            parent1.placements_by_shape, parent2.placements_by_shape
+        ):
             # 70% chance to pick the one more to the left
             if random.random() < 0.7:
-                if p1.position.col <= p2.position.col:
+                if p1.col <= p2.col:
                     selected.append(p1)
                 else:
                     selected.append(p2)
@@ -120,11 +146,20 @@ class UniformCrossover(CrossoverOperator):
                 # 30% random for diversity
                 selected.append(random.choice([p1, p2]))
 
-        # Sort by column position to repair from left to right
-        selected.sort(key=lambda p: p.position.col)
+        # Largest shapes first, then left to right: a collision then
+        # re-places a small shape, which finds room far more easily
+        selected.sort(key=lambda p: (-p.shape.area, p.col))
 
         # Repair collisions
         repaired = self._repair(selected, board_dims, config)
+        if repaired is None:
+            # Every shape must be placed, so a partial repair is no use;
+            # hand back the fitter parent's packing instead
+            parent = max(parent1, parent2)
+            return Individual(
+                list(parent.placements), board_dims[0], board_dims[1],
+                parent.fitness,
+            )
         return Individual(repaired, board_dims[0], board_dims[1])
 
     def _repair(
@@ -132,10 +167,12 @@ class UniformCrossover(CrossoverOperator):
         placements: List[Placement],
         board_dims: Tuple[int, int],
         config: ShapePackerConfig,
-    ) -> List[Placement]:
+    ) -> List[Placement] | None:
         """Repair placements by re-placing colliding shapes.
 
-        Uses greedy left-to-right strategy for better packing.
+        Uses greedy left-to-right strategy for better packing. If a shape
+        cannot be placed at all, the repair starts over with the
+        placements shuffled, up to ``_MAX_RESTARTS`` attempts.
 
         Args:
             placements: List of potentially colliding placements.
@@ -143,53 +180,42 @@ class UniformCrossover(CrossoverOperator):
             config: Configuration.
 
         Returns:
-            List of valid, non-colliding placements.
+            List of valid, non-colliding placements, or None if every
+            attempt left a shape unplaced.
         """
         width, height = board_dims
         board = Board(width, height)
-        repaired: List[Placement] = []
 
-        for placement in placements:
-            if board.can_place(placement):
-                board.place(placement)
-                repaired.append(placement)
-            else:
+        for _ in range(_MAX_RESTARTS):
+            repaired: List[Placement] = []
+            for placement in placements:
+                if board.can_place(placement):
+                    board.place(placement)
+                    repaired.append(placement)
+                    continue
                 # Re-place using greedy strategy
                 new_placement = self._try_place_greedy(placement.shape, board)
                 if new_placement is None:
                     new_placement = self._try_place_random(
                         placement.shape, board, config
                     )
-                if new_placement is not None:
-                    board.place(new_placement)
-                    repaired.append(new_placement)
-                else:
-                    # Worst case: restart repair with shuffled order
-                    random.shuffle(placements)
-                    return self._repair(placements, board_dims, config)
+                if new_placement is None:
+                    break
+                board.place(new_placement)
+                repaired.append(new_placement)
+            else:
+                return repaired
 
-        return repaired
+            # Worst case: retry in a shuffled order on the emptied board
+            random.shuffle(placements)
+            board.clear()
+
+        return None
 
     @staticmethod
     def _try_place_greedy(shape: Shape, board: Board) -> Placement | None:
-        """Try greedy left-to-right placement (optimized with sampling)."""
-        rot = random.randint(0, 3)
-        # Sample columns from left, with some randomness
-        for col in range(min(board.width, 50)):  # Limit columns checked
-            # Sample a few rows instead of all
-            for _ in range(min(board.height, 10)):
-                row = random.randint(0, board.height - 1)
-                placement = Placement(shape, Point(row, col), rot)
-                if board.can_place(placement):
-                    return placement
-            # Try other rotations at this column
-            for r in range(4):
-                if r != rot:
-                    row = random.randint(0, board.height - 1)
-                    placement = Placement(shape, Point(row, col), r)
-                    if board.can_place(placement):
-                        return placement
-        return None
+        """Try greedy left-to-right placement in the first 50 columns."""
+        return _place_leftmost(shape, board, min(board.width, 50))
 
     @staticmethod
     def _try_place_random(
@@ -202,9 +228,8 @@ class UniformCrossover(CrossoverOperator):
             rotation = random.randint(0, 3)
             row = random.randint(0, board.height - 1)
             col = random.randint(0, board.width - 1)
-            placement = Placement(shape, Point(row, col), rotation)
-            if board.can_place(placement):
-                return placement
+            if board.fits(shape, rotation, row, col):
+                return Placement.at(shape, row, col, rotation)
         return None
 
 
@@ -229,62 +254,53 @@ class RandomReplaceMutation(MutationOperator):
             config: Configuration with mutation_rate.
 
         Returns:
-            New mutated Individual.
+            New mutated Individual, or an unchanged copy if no attempt
+            could re-place every chosen shape.
         """
         num_to_mutate = max(1, floor(len(individual.placements) * config.mutation_rate))
-
-        # Shuffle and split
+        width, height = board_dims
         placements = list(individual.placements)
-        random.shuffle(placements)
-        to_mutate = placements[:num_to_mutate]
-        to_keep = placements[num_to_mutate:]
 
-        # Build board with kept placements
-        width, height = board_dims
-        board = Board(width, height)
-        for placement in to_keep:
-            board.place(placement)
-
-        # Re-place mutated shapes using greedy strategy
-        new_placements = list(to_keep)
-        for placement in to_mutate:
-            # Try greedy placement first
-            new_placement = self._try_place_greedy(placement.shape, board)
-            if new_placement is None:
-                new_placement = self._try_place_random(
-                    placement.shape, board, config
-                )
-            if new_placement is not None:
+        for _ in range(_MAX_RESTARTS):
+            # Shuffle and split
+            random.shuffle(placements)
+            to_mutate = placements[:num_to_mutate]
+            to_keep = placements[num_to_mutate:]
+            # Re-place the largest shapes while the most room is left
+            to_mutate.sort(key=lambda p: -p.shape.area)
+
+            # Build board with kept placements
+            board = Board(width, height)
+            if not board.place_all(to_keep):
+                # Kept shapes overlap; try a split that re-places one
+                continue
+
+            # Re-place mutated shapes using greedy strategy
+            new_placements = list(to_keep)
+            for placement in to_mutate:
+                # Try greedy placement first
+                new_placement = self._try_place_greedy(placement.shape, board)
+                if new_placement is None:
+                    new_placement = self._try_place_random(
+                        placement.shape, board, config
+                    )
+                if new_placement is None and board.can_place(placement):
+                    # Keep original if can't re-place
+                    new_placement = placement
+                if new_placement is None:
+                    break
                 board.place(new_placement)
                 new_placements.append(new_placement)
             else:
-                # Keep original if can't re-place
-                if board.can_place(placement):
-                    board.place(placement)
-                    new_placements.append(placement)
-                else:
-                    # Restart mutation
-                    return self.mutate(individual, board_dims, config)
+                return Individual(new_placements, width, height)
 
-        return Individual(new_placements, width, height)
+        # Retries exhausted: hand back the parent unchanged
+        return Individual(placements, width, height, individual.fitness)
 
     @staticmethod
     def _try_place_greedy(shape: Shape, board: Board) -> Placement | None:
-        """Try greedy left-to-right placement (optimized with sampling)."""
-        rot = random.randint(0, 3)
-        for col in range(min(board.width, 50)):
-            for _ in range(min(board.height, 10)):
-                row = random.randint(0, board.height - 1)
-                placement = Placement(shape, Point(row, col), rot)
-                if board.can_place(placement):
-                    return placement
-            for r in range(4):
-                if r != rot:
-                    row = random.randint(0, board.height - 1)
-                    placement = Placement(shape, Point(row, col), r)
-                    if board.can_place(placement):
-                        return placement
-        return None
+        """Try greedy left-to-right placement in the first 50 columns."""
+        return _place_leftmost(shape, board, min(board.width, 50))
 
     @staticmethod
     def _try_place_random(
@@ -297,9 +313,8 @@ class RandomReplaceMutation(MutationOperator):
             rotation = random.randint(0, 3)
             row = random.randint(0, board.height - 1)
             col = random.randint(0, board.width - 1)
-            placement = Placement(shape, Point(row, col), rotation)
-            if board.can_place(placement):
-                return placement
+            if board.fits(shape, rotation, row, col):
+                return Placement.at(shape, row, col, rotation)
         return None
 
 
@@ -332,26 +347,36 @@ class LocalSearchMutation(MutationOperator):
 
         # Keep improving until no more improvements possible
         iterations = 0
+        moved = False
         max_iterations = 3  # Limit iterations to avoid slow mutations
 
+        # Placements never overlap, so the board for each shape is the full
+        # board with that one shape lifted off
+        board = Board(width, height)
+        if not board.place_all(placements):
+            # Nudging on an empty board could stack shapes; leave it be
+            return Individual(placements, width, height, individual.fitness)
+
         while improved and iterations < max_iterations:
             improved = False
             iterations += 1
             random.shuffle(placements)
 
             for i, placement in enumerate(placements):
-                # Build board without this shape
-                board = Board(width, height)
-                for j, p in enumerate(placements):
-                    if i != j:
-                        board.place(p)
+                board.remove(placement)
 
                 # Try to move shape left
                 better = self._try_move_left(placement, board)
                 if better is not None:
                     placements[i] = better
                     improved = True
+                    moved = True
+
+                board.place(placements[i])
 
+        if not moved:
+            # Same genome in a different order: reuse the parent's fitness
+            return Individual(placements, width, height, individual.fitness)
         return Individual(placements, width, height)
 
     @staticmethod
@@ -369,17 +394,15 @@ class LocalSearchMutation(MutationOperator):
             New placement if improvement found, None otherwise.
         """
         shape = placement.shape
-        current_col = placement.position.col
+        end_col = placement.col  # Only check columns to the left
         best_placement = None
 
-        # Try all rotations, scanning from left
+        # Try all rotations; each later rotation only has to beat the best
+        # column found so far
         for rotation in range(4):
-            for col in range(current_col):  # Only check columns to the left
-                for row in range(board.height):
-                    new_placement = Placement(shape, Point(row, col), rotation)
-                    if board.can_place(new_placement):
-                        # Found a valid placement to the left
-                        if best_placement is None or col < best_placement.position.col:
-                            best_placement = new_placement
+            spot = board.leftmost_fit(shape, rotation, end_col)
+            if spot is not None:
+                row, end_col = spot
+                best_placement = Placement.at(shape, row, end_col, rotation)
 
         return best_placement
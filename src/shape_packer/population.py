@@ -8,16 +8,74 @@ Example:
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import random
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from shape_packer.board import Placement
 from shape_packer.config import ShapePackerConfig
 from shape_packer.individual import Individual
 from shape_packer.shape import Shape
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Below this many individuals, sending the work to other processes costs
+# more than building them here
+_MIN_PARALLEL_SIZE = 32
+
+
+# Shapes, board dimensions and config of a worker process. They are sent
+# once per process by init_random_worker rather than with every task.
+_worker_state: tuple | None = None
+
+
+def init_random_worker(
+    shapes: List[Shape],
+    board_dims: Tuple[int, int],
+    config: ShapePackerConfig,
+) -> None:
+    """Store what random individuals are built from in a worker process.
+
+    Must run in every worker of an executor passed to Population.random,
+    typically from the pool's initializer.
+
+    Args:
+        shapes: List of shapes to place.
+        board_dims: Tuple of (width, height).
+        config: Configuration with max_placement_attempts.
+    """
+    global _worker_state
+    _worker_state = (shapes, board_dims, config)
+
+
+def _random_genome(seed: int) -> List[Tuple[int, int, int, int]]:
+    """Build one random individual in a worker process.
+
+    Args:
+        seed: Seed for the individual, so it depends only on the seed,
+            not on which worker runs it.
+
+    Returns:
+        One (shape_id, row, col, rotation) tuple per placement. The
+        caller rebuilds the placements on its own shapes.
+    """
+    shapes, board_dims, config = _worker_state
+    random.seed(seed)
+    individual = Individual.random(shapes, board_dims, config)
+    return [
+        (p.shape.shape_id, p.row, p.col, p.rotation)
+        for p in individual.placements
+    ]
+
 
 class Population:
     """A collection of individuals with aggregate statistics.
 
+    Fitness values are gathered into a parallel list on first use, so the
+    statistics below scan plain floats instead of reading each
+    individual's fitness again. A population is not modified once built,
+    so every statistic is computed at most once and never invalidated.
+
     Attributes:
         individuals: List of individuals in the population.
     """
@@ -34,6 +92,9 @@ class Population:
         if not individuals:
             raise ValueError("Population cannot be empty")
         self.individuals = individuals
+        self._fitnesses: Optional[List[float]] = None
+        self._fittest: Optional[Individual] = None
+        self._average: Optional[float] = None
 
     @classmethod
     def random(
@@ -42,51 +103,118 @@ class Population:
         board_dims: Tuple[int, int],
         config: ShapePackerConfig,
         size: int,
+        executor: Executor | None = None,
     ) -> Population:
         """Create a population with random individuals.
 
         Args:
             shapes: List of shapes to place.
             board_dims: Tuple of (width, height).
-            config: Configuration.
+            config: Configuration; ``workers`` sets the chunk size when
+                an executor is given.
             size: Number of individuals to create.
+            executor: Optional process pool to build the individuals on.
+                Its workers must have run init_random_worker with the same
+                shapes, board_dims and config. Ignored for populations too
+                small to be worth it.
 
         Returns:
             New Population with random individuals.
         """
+        # Every individual gets its own seed from the main stream, so a
+        # seeded run starts the same with or without an executor
+        seeds = [random.getrandbits(64) for _ in range(size)]
+
+        if executor is None or size < _MIN_PARALLEL_SIZE:
+            # Seeding here would reset the main stream, so it is put back
+            # afterwards as if the individuals were built elsewhere
+            state = random.getstate()
+            individuals = []
+            for seed in seeds:
+                random.seed(seed)
+                individuals.append(Individual.random(shapes, board_dims, config))
+            random.setstate(state)
+            return cls(individuals)
+
+        chunksize = max(1, size // (4 * config.workers))
+        shapes_by_id = {shape.shape_id: shape for shape in shapes}
+        width, height = board_dims
         individuals = [
-            Individual.random(shapes, board_dims, config)
-            for _ in range(size)
+            Individual(
+                [
+                    Placement.at(shapes_by_id[shape_id], row, col, rotation)
+                    for shape_id, row, col, rotation in genome
+                ],
+                width,
+                height,
+            )
+            for genome in executor.map(_random_genome, seeds, chunksize=chunksize)
         ]
         return cls(individuals)
 
+    def split(self, count: int) -> List[Population]:
+        """Deal the individuals round-robin into smaller populations.
+
+        Args:
+            count: Number of populations, at most the population size.
+
+        Returns:
+            List of populations.
+        """
+        return [Population(self.individuals[i::count]) for i in range(count)]
+
+    @classmethod
+    def merge(cls, populations: List[Population]) -> Population:
+        """Combine populations into one, keeping their order.
+
+        Args:
+            populations: Populations to combine.
+
+        Returns:
+            New Population holding every individual.
+        """
+        return cls([ind for pop in populations for ind in pop.individuals])
+
+    def _fitness_values(self) -> List[float]:
+        """Get the cached fitness of each individual, in order."""
+        if self._fitnesses is None:
+            self._fitnesses = [ind.fitness for ind in self.individuals]
+        return self._fitnesses
+
     @property
     def fittest(self) -> Individual:
-        """Get the individual with highest fitness.
+        """Get the individual with highest fitness (cached).
+
+        Ties go to the first such individual.
 
         Returns:
             Best individual.
         """
-        return max(self.individuals)
+        if self._fittest is None:
+            values = self._fitness_values()
+            self._fittest = self.individuals[values.index(max(values))]
+        return self._fittest
 
     @property
     def average_fitness(self) -> float:
-        """Get the average fitness of the population.
+        """Get the average fitness of the population (cached).
 
         Returns:
             Mean fitness value.
         """
-        total = sum(ind.fitness for ind in self.individuals)
-        return total / len(self.individuals)
+        if self._average is None:
+            values = self._fitness_values()
+            self._average = sum(values) / len(values)
+        return self._average
 
     @property
     def fitnesses(self) -> List[float]:
         """Get all fitness values.
 
         Returns:
-            List of fitness values.
+            New list of fitness values.
         """
-        return [ind.fitness for ind in self.individuals]
+        return list(self._fitness_values())
 
     def __len__(self) -> int:
         """Get population size.
@@ -11,8 +11,8 @@ Example:
 
 from __future__ import annotations
 
-import bisect
 import heapq
+import itertools
 import random
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, List
@@ -92,18 +92,40 @@ class TournamentSelection(SelectionStrategy):
                 f"from population of {len(individuals)}"
             )
 
-        pool = list(individuals)
+        if self.with_replacement:
+            # Tournaments draw distinct indices into a fitness list
+            # gathered once, so winners are found by comparing plain
+            # floats. One random() per draw replaces random.sample, which
+            # spends most of its time on per-call setup for small k.
+            fitnesses = [ind.fitness for ind in individuals]
+            n = len(individuals)
+            k = min(self.k, n)
+            rand = random.random
+            fitness_of = fitnesses.__getitem__
+            selected = []
+            for _ in range(count):
+                candidates: List[int] = []
+                while len(candidates) < k:
+                    i = int(rand() * n)
+                    if i not in candidates:
+                        candidates.append(i)
+                selected.append(individuals[max(candidates, key=fitness_of)])
+            return selected
+
+        # The pool holds indices, so removing a winner compares ints
+        # rather than going through Individual.__eq__
+        fitnesses = [ind.fitness for ind in individuals]
+        fitness_of = fitnesses.__getitem__
+        pool = list(range(len(individuals)))
         selected: List[Individual] = []
 
         for _ in range(count):
             # Select k candidates (or fewer if pool is smaller)
             k = min(self.k, len(pool))
             candidates = random.sample(pool, k)
-            winner = max(candidates)  # Uses __lt__ comparison
-            selected.append(winner)
-
-            if not self.with_replacement:
-                pool.remove(winner)
+            winner = max(candidates, key=fitness_of)
+            selected.append(individuals[winner])
+            pool.remove(winner)
 
         return selected
 
@@ -129,15 +151,19 @@ class TruncationSelection(SelectionStrategy):
         Returns:
             List of top individuals by fitness.
         """
-        # heapq.nlargest is O(n log k) vs O(n log n) for full sort
-        return heapq.nlargest(count, individuals)
+        # heapq.nlargest is O(n log k) vs O(n log n) for full sort. Keying
+        # on the cached fitness reads it once per individual and compares
+        # plain floats, where comparing individuals goes through __lt__
+        # (and __eq__ on ties) for every heap step.
+        return heapq.nlargest(count, individuals, key=lambda ind: ind.fitness)
 
 
 class FitnessProportionalSelection(SelectionStrategy):
     """Fitness proportional (roulette wheel) selection.
 
     Probability of selection is proportional to fitness. Uses cumulative
-    sum and binary search for O(n log n) instead of the original O(n^2).
+    sum and binary search (via ``random.choices``) for O(n log n) instead
+    of the original O(n^2).
 
     Note: Requires positive fitness values.
     """
@@ -162,34 +188,20 @@ class FitnessProportionalSelection(SelectionStrategy):
         if not individuals:
             return []
 
-        # Build cumulative fitness array
         fitnesses = [ind.fitness for ind in individuals]
-        if any(f < 0 for f in fitnesses):
+        if min(fitnesses) < 0:
             raise ValueError("Fitness proportional selection requires non-negative fitness")
 
+        # Cumulative distribution; random.choices then draws every pick in
+        # one call, binary searching it internally
+        cumulative = list(itertools.accumulate(fitnesses))
+
         # Handle zero total fitness
-        total = sum(fitnesses)
-        if total == 0:
+        if cumulative[-1] == 0:
             # All equal, use uniform random
             return random.choices(individuals, k=count)
 
-        # Build cumulative distribution
-        cumulative: List[float] = []
-        running = 0.0
-        for f in fitnesses:
-            running += f
-            cumulative.append(running)
-
-        # Select using binary search
-        selected: List[Individual] = []
-        for _ in range(count):
-            pick = random.uniform(0, total)
-            idx = bisect.bisect_left(cumulative, pick)
-            # Handle edge case where pick == total
-            idx = min(idx, len(individuals) - 1)
-            selected.append(individuals[idx])
-
-        return selected
+        return random.choices(individuals, cum_weights=cumulative, k=count)
 
 
 class RandomSelection(SelectionStrategy):
@@ -11,8 +11,10 @@ Example:
 from __future__ import annotations
 
 import functools
-from dataclasses import dataclass
-from typing import FrozenSet, List, Tuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import FrozenSet, Sequence, Tuple
 
 
 class Point:
@@ -39,19 +41,114 @@ class Point:
             return NotImplemented
         return self.row == other.row and self.col == other.col
 
+    def __reduce__(self):
+        # Rebuild through __init__; the default slot restore would trip
+        # the immutability guard in __setattr__
+        return (Point, (self.row, self.col))
+
     def __repr__(self) -> str:
         return f"Point({self.row}, {self.col})"
 
 
-# Direction vectors for shape instructions
+# Direction vectors for shape instructions, as (row, col) steps
 _DIRECTIONS = {
-    "U": Point(1, 0),   # Up increases row
-    "D": Point(-1, 0),  # Down decreases row
-    "L": Point(0, -1),  # Left decreases column
-    "R": Point(0, 1),   # Right increases column
+    "U": (1, 0),   # Up increases row
+    "D": (-1, 0),  # Down decreases row
+    "L": (0, -1),  # Left decreases column
+    "R": (0, 1),   # Right increases column
 }
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_instructions(instruction_str: str) -> Tuple[Tuple[str, int], ...]:
+    """Split an instruction string into (direction, magnitude) pairs (cached).
+
+    Commas and whitespace both separate instructions.
+
+    Raises:
+        ValueError: If a magnitude is not an integer.
+    """
+    return tuple(
+        (part[0].upper(), int(part[1:]))
+        for part in instruction_str.replace(",", " ").split()
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _shape_geometry(instructions: Tuple[Tuple[str, int], ...]) -> tuple:
+    """Derive the per-rotation data of a shape path (cached).
+
+    The path is walked once; each further rotation is the previous one
+    turned a quarter.
+
+    Returns:
+        Tuple of (bounds, row_masks, row_bits, coords, layouts), each
+        holding one entry per rotation. Bounds are (min_row, max_row,
+        min_col, max_col); layouts are (min_row, end_row, min_col, end_col,
+        row_masks) with exclusive ends; row mask ``i`` covers row
+        ``min_row + i`` and bit ``j`` covers column ``min_col + j``;
+        row_bits lists the set bits of each row mask; coords are parallel
+        row and column offsets sorted by (row, col).
+
+    Raises:
+        ValueError: If instructions contain invalid directions.
+    """
+    # Everything is derived from sorted (row, col) pairs; Points are only
+    # built if get_points asks for them (see _shape_points)
+    row = col = 0
+    path = {(0, 0)}
+    for direction, magnitude in instructions:
+        try:
+            d_row, d_col = _DIRECTIONS[direction]
+        except KeyError:
+            raise ValueError(f"Invalid direction: {direction}") from None
+        for _ in range(magnitude):
+            row += d_row
+            col += d_col
+            path.add((row, col))
+    cells = [sorted(path)]
+    for _ in range(3):
+        cells.append(sorted((-c, r) for r, c in cells[-1]))
+
+    bounds = []
+    row_masks = []
+    row_bits = []
+    coords = []
+    layouts = []
+    for rotation in cells:
+        rows = [r for r, _ in rotation]
+        cols = [c for _, c in rotation]
+        min_r, max_r, min_c, max_c = rows[0], rows[-1], min(cols), max(cols)
+        masks = [0] * (max_r - min_r + 1)
+        for r, c in rotation:
+            masks[r - min_r] |= 1 << (c - min_c)
+        bounds.append((min_r, max_r, min_c, max_c))
+        row_masks.append(tuple(masks))
+        row_bits.append(tuple(
+            tuple(j for j in range(mask.bit_length()) if mask >> j & 1)
+            for mask in masks
+        ))
+        coords.append((tuple(rows), tuple(cols)))
+        layouts.append((min_r, max_r + 1, min_c, max_c + 1, row_masks[-1]))
+    return (
+        tuple(bounds), tuple(row_masks), tuple(row_bits), tuple(coords),
+        tuple(layouts),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _shape_points(
+    instructions: Tuple[Tuple[str, int], ...],
+) -> Tuple[FrozenSet[Point], ...]:
+    """Build the Point set of each rotation of a shape path (cached).
+
+    Placement and collision work on row masks, so these are only needed
+    by callers of ``Shape.get_points`` and are built on first request.
+    """
+    coords = _shape_geometry(instructions)[3]
+    return tuple(frozenset(map(Point, rows, cols)) for rows, cols in coords)
+
+
 class Shape:
     """A polyomino shape defined by movement instructions.
 
@@ -64,32 +161,39 @@ class Shape:
 
     Attributes:
         shape_id: Unique identifier for this shape.
+        max_extent: Longer side of the unrotated bounding box.
+        area: Number of cells the shape occupies.
     """
 
     def __init__(
         self,
-        instructions: List[Tuple[str, int]],
+        instructions: Sequence[Tuple[str, int]],
         shape_id: int,
     ) -> None:
         """Create a shape from parsed instructions.
 
         Args:
-            instructions: List of (direction, magnitude) tuples.
+            instructions: Sequence of (direction, magnitude) tuples.
                 Direction is one of 'U', 'D', 'L', 'R'.
             shape_id: Unique identifier for this shape.
 
         Raises:
             ValueError: If instructions contain invalid directions.
         """
-        for direction, _ in instructions:
-            if direction not in _DIRECTIONS:
-                raise ValueError(f"Invalid direction: {direction}")
-
-        self._instructions = instructions
+        self._instructions = tuple(instructions)
         self.shape_id = shape_id
-        # Pre-cache points and bounds for all rotations
-        self._cached_points = tuple(self._compute_points(r) for r in range(4))
-        self._cached_bounds = tuple(self._compute_bounds(r) for r in range(4))
+        # Rotation data depends only on the instructions, so shapes with
+        # the same path share one immutable copy; instructions are only
+        # validated and traced the first time they are seen
+        (
+            self._cached_bounds,
+            self._cached_row_masks,
+            self._cached_row_bits,
+            self._cached_coords,
+            self._cached_layouts,
+        ) = _shape_geometry(self._instructions)
+        self.max_extent = max(self.bounding_box)
+        self.area = len(self._cached_coords[0][0])
 
     @classmethod
     def from_instructions(cls, instruction_str: str, shape_id: int) -> Shape:
@@ -106,60 +210,57 @@ class Shape:
         Raises:
             ValueError: If instruction string is malformed.
         """
-        instructions: List[Tuple[str, int]] = []
-
-        # Handle both comma and space separated formats
-        # Replace commas with spaces, then split on whitespace
-        normalized = instruction_str.replace(",", " ")
-        for part in normalized.split():
-            part = part.strip()
-            if not part:
-                continue
-            direction = part[0].upper()
-            magnitude = int(part[1:])
-            instructions.append((direction, magnitude))
-        return cls(instructions, shape_id)
-
-    def _compute_points(self, rotation: int) -> FrozenSet[Point]:
-        """Compute points for a rotation (called once at init)."""
-        current = Point(0, 0)
-        points = {current}
-        for direction, magnitude in self._instructions:
-            delta = _DIRECTIONS[direction]
-            for _ in range(magnitude):
-                current = current + delta
-                points.add(current)
-        result = points
-        for _ in range(rotation % 4):
-            result = frozenset(Point(-p.col, p.row) for p in result)
-        return frozenset(result)
-
-    def _compute_bounds(self, rotation: int) -> Tuple[int, int, int, int]:
-        """Compute bounds for a rotation (called once at init)."""
-        points = self._cached_points[rotation % 4]
-        rows = [p.row for p in points]
-        cols = [p.col for p in points]
-        return (min(rows), max(rows), min(cols), max(cols))
+        # The parsed tuple is immutable, so it is shared rather than copied
+        return cls(_parse_instructions(instruction_str), shape_id)
 
     def get_points(self, rotation: int = 0) -> FrozenSet[Point]:
-        """Get all points occupied by this shape at origin (pre-cached)."""
-        return self._cached_points[rotation % 4]
+        """Get all points occupied by this shape at origin (cached)."""
+        return _shape_points(self._instructions)[rotation % 4]
 
-    @functools.lru_cache(maxsize=2048)
     def get_points_at(
         self,
         position: Point,
         rotation: int = 0,
     ) -> FrozenSet[Point]:
-        """Get points when shape is placed at a position (cached)."""
-        base_points = self._cached_points[rotation % 4]
+        """Get points when shape is placed at a position.
+
+        Built from the cached int offsets on each call. A method-level
+        lru_cache would keep every Shape it saw alive and rarely hits,
+        since positions seldom repeat.
+        """
+        rows, cols = self._cached_coords[rotation % 4]
         pr, pc = position.row, position.col
-        return frozenset(Point(p.row + pr, p.col + pc) for p in base_points)
+        return frozenset(Point(r + pr, c + pc) for r, c in zip(rows, cols))
 
     def get_bounds(self, rotation: int = 0) -> Tuple[int, int, int, int]:
         """Get min/max row/col bounds for fast bounds checking (pre-cached)."""
         return self._cached_bounds[rotation % 4]
 
+    def get_row_masks(self, rotation: int = 0) -> Tuple[int, ...]:
+        """Get per-row column bitmasks relative to the bounds (pre-cached)."""
+        return self._cached_row_masks[rotation % 4]
+
+    def get_row_bits(self, rotation: int = 0) -> Tuple[Tuple[int, ...], ...]:
+        """Get the set bit positions of each row mask (pre-cached)."""
+        return self._cached_row_bits[rotation % 4]
+
+    def get_layout(
+        self, rotation: int = 0
+    ) -> Tuple[int, int, int, int, Tuple[int, ...]]:
+        """Get everything a placement needs for a rotation in one lookup.
+
+        Returns:
+            Tuple of (min_row, end_row, min_col, end_col, row_masks), where
+            the end values are exclusive.
+        """
+        return self._cached_layouts[rotation % 4]
+
+    def get_coords(
+        self, rotation: int = 0
+    ) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Get parallel (rows, cols) offset tuples for a rotation (pre-cached)."""
+        return self._cached_coords[rotation % 4]
+
     @functools.cached_property
     def bounding_box(self) -> Tuple[int, int]:
         """Get the bounding box dimensions of the unrotated shape.
@@ -167,12 +268,12 @@ class Shape:
         Returns:
             Tuple of (width, height).
         """
-        points = self.get_points(0)
-        rows = [p.row for p in points]
-        cols = [p.col for p in points]
-        width = max(cols) - min(cols) + 1
-        height = max(rows) - min(rows) + 1
-        return (width, height)
+        min_r, max_r, min_c, max_c = self._cached_bounds[0]
+        return (max_c - min_c + 1, max_r - min_r + 1)
+
+    def __reduce__(self):
+        """Pickle only the instructions; rotation caches are rebuilt on load."""
+        return (Shape, (self._instructions, self.shape_id))
 
     def __repr__(self) -> str:
         """Return string representation of shape."""
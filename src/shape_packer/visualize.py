@@ -15,6 +15,8 @@ import argparse
 import random
 import sys
 import time
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -23,7 +25,8 @@ import matplotlib.patches as patches
 import matplotlib.colors as mcolors
 import matplotlib.gridspec as gridspec
 import numpy as np
-from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.animation import FuncAnimation
+from PIL import Image
 
 from sat_solver import termination
 
@@ -34,8 +37,8 @@ from shape_packer.io import parse_input_file
 from shape_packer.operators import RandomReplaceMutation
 from shape_packer.population import Population
 from shape_packer.selection import TournamentSelection, TruncationSelection
-from shape_packer.shape import Point, Shape
-from matplotlib.collections import PatchCollection
+from shape_packer.shape import Shape
+from matplotlib.collections import LineCollection, PolyCollection
 
 
 class RepairingCrossover:
@@ -49,22 +52,18 @@ class RepairingCrossover:
         config: ShapePackerConfig,
     ) -> Individual:
         """Create offspring with thorough repair strategy."""
-        p1_placements = {p.shape.shape_id: p for p in parent1.placements}
-        p2_placements = {p.shape.shape_id: p for p in parent2.placements}
-
         # 60% prefer left placement, 40% random - slight bias for convergence
+        rand = random.random
         selected = []
-        for shape_id in p1_placements:
-            p1 = p1_placements[shape_id]
-            p2 = p2_placements[shape_id]
-            if random.random() < 0.6:
+        for p1, p2 in self._pair_placements(parent1, parent2):
+            if rand() < 0.6:
                 # Pick the one more to the left
-                if p1.position.col <= p2.position.col:
+                if p1.col <= p2.col:
                     selected.append(p1)
                 else:
                     selected.append(p2)
             else:
-                selected.append(random.choice([p1, p2]))
+                selected.append(p1 if rand() < 0.5 else p2)
 
         # Repair with persistence - never discard shapes
         width, height = board_dims
@@ -85,43 +84,129 @@ class RepairingCrossover:
 
         return Individual(repaired, width, height)
 
+    @staticmethod
+    def _pair_placements(parent1, parent2):
+        """Pair up the two parents' placements of each shape.
+
+        Both parents list their placements by shape_id, so when they hold
+        the same shapes the two placements of each shape line up. A repair
+        can drop a shape, though; then the pairs are matched by shape_id,
+        and a shape only one parent holds is paired with itself.
+        """
+        by_shape1 = parent1.placements_by_shape
+        by_shape2 = parent2.placements_by_shape
+        pairs = list(zip(by_shape1, by_shape2))
+        if len(by_shape1) == len(by_shape2) and all(
+            p1.shape.shape_id == p2.shape.shape_id for p1, p2 in pairs
+        ):
+            return pairs
+
+        placements2 = {p.shape.shape_id: p for p in by_shape2}
+        pairs = []
+        for p1 in by_shape1:
+            p2 = placements2.pop(p1.shape.shape_id, p1)
+            pairs.append((p1, p2))
+        pairs.extend((p2, p2) for p2 in placements2.values())
+        return pairs
+
     def _repair_placement(self, placement, board, width, height, config):
-        """Try multiple strategies to fix a colliding placement (optimized)."""
+        """Try multiple strategies to fix a colliding placement (optimized).
+
+        Candidates are drawn with plain ``random()`` calls and tested with
+        ``Board.fits``; only the one that fits becomes a Placement.
+        """
         shape = placement.shape
-        orig_row, orig_col = placement.position.row, placement.position.col
+        orig_row, orig_col = placement.row, placement.col
+        rand = random.random
+        fits = board.fits
 
         # Strategy 1: Try different rotations at same position
         for rot in range(4):
-            p = Placement(shape, Point(orig_row, orig_col), rot)
-            if board.can_place(p):
-                return p
+            if fits(shape, rot, orig_row, orig_col):
+                return Placement.at(shape, orig_row, orig_col, rot)
 
         # Strategy 2: Limited spiral search (max 10 distance)
         max_dist = min(10, max(width, height) // 4)
         for dist in range(1, max_dist + 1):
+            span = 2 * dist + 1
             # Sample perimeter instead of checking all
             for _ in range(min(8 * dist, 32)):  # Sample up to 32 positions per ring
-                drow = random.randint(-dist, dist)
-                dcol = random.choice([-dist, dist]) if abs(drow) != dist else random.randint(-dist, dist)
+                drow = int(rand() * span) - dist
+                if abs(drow) != dist:
+                    dcol = dist if rand() < 0.5 else -dist
+                else:
+                    dcol = int(rand() * span) - dist
                 new_row, new_col = orig_row + drow, orig_col + dcol
                 if 0 <= new_row < height and 0 <= new_col < width:
-                    rot = random.randint(0, 3)
-                    p = Placement(shape, Point(new_row, new_col), rot)
-                    if board.can_place(p):
-                        return p
+                    rot = int(rand() * 4)
+                    if fits(shape, rot, new_row, new_col):
+                        return Placement.at(shape, new_row, new_col, rot)
 
         # Strategy 3: Random sampling (faster than systematic scan)
         for _ in range(50):
-            rot = random.randint(0, 3)
-            row = random.randint(0, height - 1)
-            col = random.randint(0, width - 1)
-            p = Placement(shape, Point(row, col), rot)
-            if board.can_place(p):
-                return p
+            rot = int(rand() * 4)
+            row = int(rand() * height)
+            col = int(rand() * width)
+            if fits(shape, rot, row, col):
+                return Placement.at(shape, row, col, rot)
 
         return None
 
 
+def _band_vertices(xs, lower, upper) -> np.ndarray:
+    """Outline the region between two curves the way fill_between does.
+
+    Args:
+        xs: X values, at least one.
+        lower: Lower curve, or a scalar baseline.
+        upper: Upper curve.
+
+    Returns:
+        (2 * len(xs) + 2, 2) array of polygon vertices: along the lower
+        curve left to right, then back along the upper curve.
+    """
+    xs = np.asarray(xs, dtype=float)
+    lower = np.broadcast_to(np.asarray(lower, dtype=float), xs.shape)
+    upper = np.asarray(upper, dtype=float)
+    return np.concatenate([
+        [(xs[0], upper[0])],
+        np.column_stack([xs, lower]),
+        [(xs[-1], upper[-1])],
+        np.column_stack([xs[::-1], upper[::-1]]),
+    ])
+
+
+def _set_ylim(ax, bottom: float, top: float) -> None:
+    """Set y-limits, skipping the call (and its redraw) if they are unchanged."""
+    if ax.get_ylim() != (bottom, top):
+        ax.set_ylim(bottom, top)
+
+
+def _fit_palette(images: List[Image.Image]) -> Image.Image:
+    """Fit one 256-color GIF palette to several RGB images of the same size.
+
+    Args:
+        images: Frames whose colors the palette should cover.
+
+    Returns:
+        Palette image to pass to ``Image.quantize``.
+    """
+    width, height = images[0].size
+    sheet = Image.new("RGB", (width, height * len(images)))
+    for i, image in enumerate(images):
+        sheet.paste(image, (0, height * i))
+    return sheet.quantize(method=Image.Quantize.MEDIANCUT)
+
+
+# Generations without a new best before random immigrants are let in
+_STAGNATION_LIMIT = 10
+
+# Rows of VisualShapePackerEA's history buffer
+_HISTORY_ROWS = ("best", "avg", "min", "diversity", "improvement", "cumulative")
+
+# Corners of a board cell relative to its (col, row)
+_UNIT_SQUARE = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=float)
+
 # Color scheme
 COLORS = {
     "bg": "#1a1a2e",
@@ -144,9 +229,56 @@ SHAPE_COLORS = [
     "#ee5a24", "#0abde3", "#f368e0", "#01a3a4", "#c44569",
     "#7bed9f", "#70a1ff", "#eccc68", "#ff6348", "#5352ed",
 ]
+# The same palette as an RGBA array, indexed by shape_id % len(SHAPE_COLORS)
+_SHAPE_RGBA = mcolors.to_rgba_array(SHAPE_COLORS)
+
+
+class _PlotHistory:
+    """Per-generation statistics read by the plots, as views of one buffer.
 
+    Subclasses keep ``_history`` (one row per name in _HISTORY_ROWS, one
+    column per generation) and ``_history_len`` up to date.
+    """
+
+    _history: np.ndarray
+    _history_len: int
+
+    def _history_row(self, name: str) -> np.ndarray:
+        """Get one history row so far, as a view into the buffer."""
+        return self._history[_HISTORY_ROWS.index(name), :self._history_len]
+
+    @property
+    def best_fitness_history(self) -> np.ndarray:
+        """Best fitness found so far, per generation."""
+        return self._history_row("best")
+
+    @property
+    def avg_fitness_history(self) -> np.ndarray:
+        """Average population fitness, per generation."""
+        return self._history_row("avg")
 
-class VisualShapePackerEA:
+    @property
+    def min_fitness_history(self) -> np.ndarray:
+        """Lowest population fitness, per generation."""
+        return self._history_row("min")
+
+    @property
+    def diversity_history(self) -> np.ndarray:
+        """Standard deviation of population fitness, per generation."""
+        return self._history_row("diversity")
+
+    @property
+    def improvement_history(self) -> np.ndarray:
+        """Gain in best fitness over the previous generation."""
+        return self._history_row("improvement")
+
+    @property
+    def cumulative_improvement_history(self) -> np.ndarray:
+        """Running total of improvement_history."""
+        return self._history_row("cumulative")
+
+
+class VisualShapePackerEA(_PlotHistory):
     """Shape packer EA with visualization callbacks.
 
     This version yields control after each generation to allow visualization
@@ -176,13 +308,19 @@ class VisualShapePackerEA:
         self._population: Optional[Population] = None
         self._generation = 0
         self._best_ever: Optional[Individual] = None
-
-        # History for plotting
-        self.best_fitness_history: List[float] = []
-        self.avg_fitness_history: List[float] = []
-        self.min_fitness_history: List[float] = []
-        self.diversity_history: List[float] = []
-        self.improvement_history: List[float] = []
+        # Generations since the best last improved or immigrants arrived
+        self._stagnation = 0
+
+        # History for plotting: one column per generation, rows in
+        # _HISTORY_ROWS order. The buffer doubles when full, and the
+        # *_history properties are views of its filled part.
+        self._history = np.empty((len(_HISTORY_ROWS), 64))
+        self._history_len = 0
+        # Extremes of the history so far, kept up to date by step() so the
+        # plots never rescan it. The highest fitness is simply the last
+        # best, which never decreases.
+        self.lowest_fitness = 0.0
+        self.highest_diversity = 0.0
 
     def initialize(self) -> None:
         """Initialize the population."""
@@ -194,14 +332,20 @@ class VisualShapePackerEA:
         )
         self._best_ever = self._population.fittest
         self._generation = 0
+        self._stagnation = 0
 
         # Initialize history
         fitnesses = self._population.fitnesses
-        self.best_fitness_history = [self._best_ever.fitness]
-        self.avg_fitness_history = [self._population.average_fitness]
-        self.min_fitness_history = [min(fitnesses)]
-        self.diversity_history = [np.std(fitnesses) if len(fitnesses) > 1 else 0.0]
-        self.improvement_history = [0.0]
+        self._history_len = 0
+        self.lowest_fitness = min(fitnesses)
+        self.highest_diversity = np.std(fitnesses) if len(fitnesses) > 1 else 0.0
+        self._record(
+            self._best_ever.fitness,
+            self._population.average_fitness,
+            self.lowest_fitness,
+            self.highest_diversity,
+            0.0,
+        )
 
     def step(self) -> bool:
         """Run one generation with elitism and local search.
@@ -241,15 +385,18 @@ class VisualShapePackerEA:
         combined = self._population.individuals + offspring
         survivors = self._survival_selection.select(combined, self.config.mu)
 
-        # Ensure elite survives
-        if elite not in survivors:
+        # Ensure elite survives (checked by identity, not equality)
+        if not any(ind is elite for ind in survivors):
             survivors[-1] = elite
 
-        # Random immigrants (5% of population) for diversity
-        num_immigrants = max(1, self.config.mu // 20)
-        for i in range(num_immigrants):
-            immigrant = Individual.random(self.shapes, self.board_dims, self.config)
-            survivors[-(i + 2)] = immigrant  # Replace worst individuals (except elite)
+        # Random immigrants (5% of population) for diversity, only once the
+        # search has stalled; while the best improves they rarely survive
+        if self._stagnation >= _STAGNATION_LIMIT:
+            num_immigrants = max(1, self.config.mu // 20)
+            for i in range(num_immigrants):
+                immigrant = Individual.random(self.shapes, self.board_dims, self.config)
+                survivors[-(i + 2)] = immigrant  # Replace worst individuals (except elite)
+            self._stagnation = 0
 
         self._population = Population(survivors)
 
@@ -257,17 +404,46 @@ class VisualShapePackerEA:
         current_best = self._population.fittest
         if current_best.fitness > self._best_ever.fitness:
             self._best_ever = current_best
+            self._stagnation = 0
+        else:
+            self._stagnation += 1
 
         # Record history
         fitnesses = self._population.fitnesses
-        self.best_fitness_history.append(self._best_ever.fitness)
-        self.avg_fitness_history.append(self._population.average_fitness)
-        self.min_fitness_history.append(min(fitnesses))
-        self.diversity_history.append(np.std(fitnesses) if len(fitnesses) > 1 else 0.0)
-        self.improvement_history.append(self._best_ever.fitness - prev_best)
+        min_fitness = min(fitnesses)
+        diversity = np.std(fitnesses) if len(fitnesses) > 1 else 0.0
+        self._record(
+            self._best_ever.fitness,
+            self._population.average_fitness,
+            min_fitness,
+            diversity,
+            self._best_ever.fitness - prev_best,
+        )
+        self.lowest_fitness = min(self.lowest_fitness, min_fitness)
+        self.highest_diversity = max(self.highest_diversity, diversity)
 
         return True
 
+    def _record(
+        self,
+        best: float,
+        average: float,
+        minimum: float,
+        diversity: float,
+        improvement: float,
+    ) -> None:
+        """Append one generation to the history buffer, growing it if full."""
+        n = self._history_len
+        if n == self._history.shape[1]:
+            grown = np.empty((len(_HISTORY_ROWS), 2 * n))
+            grown[:, :n] = self._history
+            self._history = grown
+        cumulative = self._history[5, n - 1] + improvement if n else improvement
+        self._history[:, n] = (
+            best, average, minimum, diversity, improvement, cumulative
+        )
+        self._history_len = n + 1
+
     @property
     def generation(self) -> int:
         return self._generation
@@ -281,6 +457,25 @@ class VisualShapePackerEA:
         return self._population
 
 
+class _Frame(_PlotHistory):
+    """Everything one frame shows, detached from the EA.
+
+    Stands in for the VisualShapePackerEA when a recorded frame is drawn
+    later, possibly in another process: it has the attributes the board
+    and plots read, frozen at the generation it was taken.
+    """
+
+    def __init__(self, ea: VisualShapePackerEA) -> None:
+        """Record the EA's current state."""
+        self.board_dims = ea.board_dims
+        self.generation = ea.generation
+        self.best = ea.best
+        self.lowest_fitness = ea.lowest_fitness
+        self.highest_diversity = ea.highest_diversity
+        self._history_len = ea._history_len
+        self._history = ea._history[:, :ea._history_len].copy()
+
+
 class ShapePackerVisualizer:
     """Real-time visualization of shape packer EA with modern dark theme."""
 
@@ -291,6 +486,7 @@ class ShapePackerVisualizer:
         max_generations: int = 1000,
         save_path: Optional[Path] = None,
         duration_seconds: Optional[int] = None,
+        max_fps: Optional[float] = None,
     ) -> None:
         """Create visualizer.
 
@@ -300,13 +496,27 @@ class ShapePackerVisualizer:
             max_generations: Maximum generations to run.
             save_path: Path to save animation as GIF. If None, shows live.
             duration_seconds: Max duration in seconds (for GIF saving).
+            max_fps: Live display only: redraw at most this often, running
+                further batches of update_interval generations in between.
+                If None, every batch is drawn.
         """
         self.ea = ea
         self.update_interval = update_interval
         self.max_generations = max_generations
         self.save_path = save_path
         self.duration_seconds = duration_seconds
+        self.max_fps = max_fps
         self._start_time: Optional[float] = None
+        # Minimum time between redraws while throttled, and when the last
+        # frame was handed to the canvas
+        self._frame_period: Optional[float] = None
+        self._last_draw = 0.0
+        # Generation numbers for the plots' x axes; each update slices a
+        # view rather than building a fresh list
+        self._xs = np.arange(max_generations + 1, dtype=float)
+        # Rendered figure minus everything a frame changes, saved by the
+        # first GIF frame
+        self._background = None
 
         # Set up dark theme
         plt.style.use("dark_background")
@@ -381,11 +591,36 @@ class ShapePackerVisualizer:
         )
         self.ax_board.add_patch(board_rect)
 
-        # Light grid
-        for x in range(width + 1):
-            self.ax_board.axvline(x, color=COLORS["grid"], alpha=0.1, linewidth=0.5)
-        for y in range(height + 1):
-            self.ax_board.axhline(y, color=COLORS["grid"], alpha=0.1, linewidth=0.5)
+        # Light grid, one collection per direction instead of a Line2D per
+        # line. Like axvline/axhline, each line spans the whole axes. It
+        # sits under the cells, as part of the background _grab_frame keeps.
+        grid_style = dict(
+            colors=COLORS["grid"], alpha=0.1, linewidths=0.5,
+            capstyle="projecting", zorder=1,
+        )
+        self.ax_board.add_collection(LineCollection(
+            [[(x, 0), (x, 1)] for x in range(width + 1)],
+            transform=self.ax_board.get_xaxis_transform(),
+            **grid_style,
+        ), autolim=False)
+        self.ax_board.add_collection(LineCollection(
+            [[(0, y), (1, y)] for y in range(height + 1)],
+            transform=self.ax_board.get_yaxis_transform(),
+            **grid_style,
+        ), autolim=False)
+
+        # Occupied cells, one square each, and the highlight over the empty
+        # columns on the right. Both are created once and updated in place
+        # by _draw_board.
+        self._cells = PolyCollection(
+            [], edgecolor="#ffffff", linewidth=0.2, alpha=0.9
+        )
+        self.ax_board.add_collection(self._cells, autolim=False)
+        self._empty_rect = patches.Rectangle(
+            (0, 0), 0, height,
+            facecolor="#1dd1a1", alpha=0.15, linewidth=0, visible=False,
+        )
+        self.ax_board.add_patch(self._empty_rect)
 
         # Remove axis spines for cleaner look
         self.ax_board.spines["top"].set_visible(False)
@@ -407,7 +642,10 @@ class ShapePackerVisualizer:
         )
 
         self.ax_fitness.legend(loc="lower right", fontsize=6, framealpha=0.3)
-        self.fill_fitness = None
+        # Band between best and min; its outline is replaced every frame
+        self.fill_fitness = self.ax_fitness.fill_between(
+            [], [], alpha=0.15, color=COLORS["best_line"]
+        )
 
     def _setup_diversity_plot(self) -> None:
         """Set up the population diversity plot."""
@@ -417,7 +655,9 @@ class ShapePackerVisualizer:
         self.line_diversity, = self.ax_diversity.plot(
             [], [], color=COLORS["diversity"], linewidth=1.5
         )
-        self.fill_diversity = None
+        self.fill_diversity = self.ax_diversity.fill_between(
+            [], [], alpha=0.2, color=COLORS["diversity"]
+        )
 
     def _setup_improvement_plot(self) -> None:
         """Set up the improvement rate plot (cumulative)."""
@@ -427,50 +667,51 @@ class ShapePackerVisualizer:
         self.line_cumulative, = self.ax_improvement.plot(
             [], [], color=COLORS["improvement"], linewidth=1.5
         )
-        self.fill_improvement = None
+        self.fill_improvement = self.ax_improvement.fill_between(
+            [], [], alpha=0.2, color=COLORS["improvement"]
+        )
 
     def _draw_board(self, individual: Individual) -> None:
         """Draw the current best solution on the board (optimized)."""
-        # Clear previous shapes
-        while len(self.ax_board.patches) > 1:
-            self.ax_board.patches[-1].remove()
-        # Remove old collections
-        for coll in list(self.ax_board.collections):
-            coll.remove()
-
         width, height = self.ea.board_dims
 
-        # Batch rectangles by color for faster rendering
-        rects_by_color = {}
-        rightmost = -1
-
+        # Group shapes by color, colors in order of their first shape
+        by_color = defaultdict(list)
+        num_colors = len(SHAPE_COLORS)
         for placement in individual.placements:
-            color = SHAPE_COLORS[placement.shape.shape_id % len(SHAPE_COLORS)]
-            if color not in rects_by_color:
-                rects_by_color[color] = []
-
-            for point in placement.points:
-                if 0 <= point.col < width and 0 <= point.row < height:
-                    rightmost = max(rightmost, point.col)
-                    rects_by_color[color].append(
-                        patches.Rectangle((point.col, point.row), 1, 1)
-                    )
-
-        # Add collections (much faster than individual patches)
-        for color, rects in rects_by_color.items():
-            if rects:
-                pc = PatchCollection(rects, facecolor=color, edgecolor="#ffffff",
-                                     linewidth=0.2, alpha=0.9)
-                self.ax_board.add_collection(pc)
+            by_color[placement.shape.shape_id % num_colors].append(placement)
+        ordered = [p for group in by_color.values() for p in group]
+
+        # Every occupied cell as parallel arrays, shape by shape: each
+        # shape's cell offsets plus its origin, repeated once per cell
+        counts = [p.shape.area for p in ordered]
+        coords = [p.shape.get_coords(p.rotation) for p in ordered]
+        rows = np.fromiter(chain.from_iterable(c[0] for c in coords), dtype=np.intp)
+        cols = np.fromiter(chain.from_iterable(c[1] for c in coords), dtype=np.intp)
+        rows += np.repeat(np.array([p.row for p in ordered], dtype=np.intp), counts)
+        cols += np.repeat(np.array([p.col for p in ordered], dtype=np.intp), counts)
+        # Each shape's color is its group's key, so the color indices come
+        # from the groups rather than another pass over the shapes
+        shape_colors = np.repeat(
+            np.fromiter(by_color, dtype=np.intp, count=len(by_color)),
+            [len(group) for group in by_color.values()],
+        )
+        color_ids = np.repeat(shape_colors, counts)
+
+        visible = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+        rows = rows[visible]
+        cols = cols[visible]
+        rightmost = int(cols.max()) if len(cols) else -1
+
+        # Swap the squares and their colors into the existing collection
+        origins = np.column_stack([cols, rows]).astype(float)
+        self._cells.set_verts(origins[:, None] + _UNIT_SQUARE)
+        self._cells.set_facecolor(_SHAPE_RGBA[color_ids[visible]])
 
         # Highlight empty columns
         empty_cols = width - rightmost - 1
-        if rightmost < width - 1:
-            empty_rect = patches.Rectangle(
-                (rightmost + 1, 0), empty_cols, height,
-                facecolor="#1dd1a1", alpha=0.15, linewidth=0,
-            )
-            self.ax_board.add_patch(empty_rect)
+        self._empty_rect.set_visible(rightmost < width - 1)
+        self._empty_rect.set_bounds(rightmost + 1, 0, empty_cols, height)
 
         # Update title
         self.ax_board.set_title(
@@ -478,39 +719,44 @@ class ShapePackerVisualizer:
             color=COLORS["text"], fontsize=11, fontweight="bold", pad=8,
         )
 
+    def _generations(self, count: int) -> np.ndarray:
+        """Get the first count generation numbers as a view.
+
+        Args:
+            count: Number of history entries being plotted.
+
+        Returns:
+            Array of 0 .. count - 1.
+        """
+        if count > len(self._xs):
+            # A longer run than max_generations, e.g. on a frame worker
+            self._xs = np.arange(max(count, 2 * len(self._xs)), dtype=float)
+        return self._xs[:count]
+
     def _update_fitness_plot(self) -> None:
         """Update the fitness convergence plot."""
-        generations = list(range(len(self.ea.best_fitness_history)))
+        generations = self._generations(len(self.ea.best_fitness_history))
 
         self.line_best.set_data(generations, self.ea.best_fitness_history)
         self.line_avg.set_data(generations, self.ea.avg_fitness_history)
         self.line_min.set_data(generations, self.ea.min_fitness_history)
 
         # Update fill between best and min
-        if self.fill_fitness:
-            self.fill_fitness.remove()
         if len(generations) > 1:
-            self.fill_fitness = self.ax_fitness.fill_between(
+            self.fill_fitness.set_verts([_band_vertices(
                 generations,
                 self.ea.min_fitness_history,
                 self.ea.best_fitness_history,
-                alpha=0.15,
-                color=COLORS["best_line"],
-            )
+            )])
 
         # Adjust axes
-        if generations:
+        if len(generations):
             self.ax_fitness.set_xlim(0, max(10, len(generations)))
-            all_fitness = (
-                self.ea.best_fitness_history +
-                self.ea.avg_fitness_history +
-                self.ea.min_fitness_history
-            )
-            if all_fitness:
-                min_f = min(all_fitness)
-                max_f = max(all_fitness)
-                margin = (max_f - min_f) * 0.1 or 1
-                self.ax_fitness.set_ylim(max(0, min_f - margin), max_f + margin)
+            # Min <= avg <= best every generation, and best never drops
+            min_f = self.ea.lowest_fitness
+            max_f = self.ea.best_fitness_history[-1]
+            margin = (max_f - min_f) * 0.1 or 1
+            _set_ylim(self.ax_fitness, max(0, min_f - margin), max_f + margin)
 
         self.ax_fitness.set_title(
             f"Gen {self.ea.generation} | Best: {self.ea.best.fitness:.0f}",
@@ -519,29 +765,23 @@ class ShapePackerVisualizer:
 
     def _update_diversity_plot(self) -> None:
         """Update the population diversity plot."""
-        generations = list(range(len(self.ea.diversity_history)))
+        generations = self._generations(len(self.ea.diversity_history))
 
         self.line_diversity.set_data(generations, self.ea.diversity_history)
 
         # Update fill
-        if self.fill_diversity:
-            self.fill_diversity.remove()
         if len(generations) > 1:
-            self.fill_diversity = self.ax_diversity.fill_between(
-                generations,
-                0,
-                self.ea.diversity_history,
-                alpha=0.2,
-                color=COLORS["diversity"],
-            )
+            self.fill_diversity.set_verts([_band_vertices(
+                generations, 0, self.ea.diversity_history
+            )])
 
         # Adjust axes
-        if generations:
+        if len(generations):
             self.ax_diversity.set_xlim(0, max(10, len(generations)))
-            max_div = max(self.ea.diversity_history) if self.ea.diversity_history else 1
-            self.ax_diversity.set_ylim(0, max_div * 1.2 or 1)
+            _set_ylim(self.ax_diversity, 0, self.ea.highest_diversity * 1.2 or 1)
 
-        current_div = self.ea.diversity_history[-1] if self.ea.diversity_history else 0
+        diversity = self.ea.diversity_history
+        current_div = diversity[-1] if len(diversity) else 0
         self.ax_diversity.set_title(
             f"Diversity σ={current_div:.1f}",
             color=COLORS["text"], fontsize=8, pad=3,
@@ -549,25 +789,23 @@ class ShapePackerVisualizer:
 
     def _update_improvement_plot(self) -> None:
         """Update the cumulative improvement plot."""
-        generations = list(range(len(self.ea.improvement_history)))
-
         # Cumulative improvement from start
-        cumulative = np.cumsum(self.ea.improvement_history)
+        cumulative = self.ea.cumulative_improvement_history
+        generations = self._generations(len(cumulative))
+
         self.line_cumulative.set_data(generations, cumulative)
 
         # Update fill
-        if self.fill_improvement:
-            self.fill_improvement.remove()
         if len(generations) > 1:
-            self.fill_improvement = self.ax_improvement.fill_between(
-                generations, 0, cumulative, alpha=0.2, color=COLORS["improvement"]
-            )
+            self.fill_improvement.set_verts([_band_vertices(
+                generations, 0, cumulative
+            )])
 
         # Adjust axes
-        if generations:
+        if len(generations):
             self.ax_improvement.set_xlim(0, max(10, len(generations)))
-            max_c = max(cumulative) if len(cumulative) > 0 else 1
-            self.ax_improvement.set_ylim(0, max(10, max_c * 1.1))
+            # Gains are never negative, so the total so far is the maximum
+            _set_ylim(self.ax_improvement, 0, max(10, cumulative[-1] * 1.1))
 
         total_gain = cumulative[-1] if len(cumulative) > 0 else 0
         self.ax_improvement.set_title(
@@ -585,25 +823,134 @@ class ShapePackerVisualizer:
                 return True
         return False
 
-    def _animate(self, frame: int) -> None:
-        """Animation update function."""
-        # Run multiple generations per frame for speed
-        for _ in range(self.update_interval):
-            if self._should_stop():
-                return
-            self.ea.step()
+    def _advance(self) -> bool:
+        """Run the generations shown by the next frame.
+
+        Returns:
+            False if the run stopped first, leaving nothing new to draw.
+        """
+        # Run multiple generations per frame for speed; while throttled,
+        # keep running batches until the frame period is up
+        while True:
+            for _ in range(self.update_interval):
+                if self._should_stop():
+                    return False
+                self.ea.step()
+            if (self._frame_period is None
+                    or time.perf_counter() - self._last_draw >= self._frame_period):
+                return True
 
+    def _draw_frame(self) -> None:
+        """Draw the board and plots for the EA's current state."""
         self._draw_board(self.ea.best)
         self._update_fitness_plot()
         self._update_diversity_plot()
         self._update_improvement_plot()
 
-    def _frame_generator(self):
-        """Generate frames until stopping condition is met."""
-        frame = 0
-        while not self._should_stop():
-            yield frame
-            frame += 1
+    def _animate(self, frame: int) -> None:
+        """Animation update function."""
+        if self._advance():
+            self._draw_frame()
+            self._last_draw = time.perf_counter()
+
+    def _grab_frame(self) -> Image.Image:
+        """Render the figure once and copy it out as an RGB image.
+
+        Only the three plots and the board's cells, empty-column highlight
+        and title change between frames. The first frame renders the rest
+        once as a background; later frames restore it and draw just the
+        changing artists on top, skipping the board's grid and ticks.
+        """
+        canvas = self.fig.canvas
+        # The spines go on top again since narrow cells can reach them
+        changing = [
+            self.ax_fitness, self.ax_diversity, self.ax_improvement,
+            self._cells, self._empty_rect, self.ax_board.title,
+            self.ax_board.spines["left"], self.ax_board.spines["bottom"],
+        ]
+        if self._background is None:
+            # Animated artists are left out of a normal draw
+            for artist in changing:
+                artist.set_animated(True)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        else:
+            canvas.restore_region(self._background)
+        for artist in changing:
+            self.fig.draw_artist(artist)
+        rgba = np.asarray(canvas.buffer_rgba())
+        return Image.fromarray(rgba[..., :3])
+
+    def _save_gif(self) -> None:
+        """Record frames until the stopping condition and write the GIF.
+
+        Frames are rendered once each and handed straight to Pillow;
+        FuncAnimation with PillowWriter drew every frame twice (once on the
+        canvas, once more in savefig), and its initial draw advanced the EA
+        without recording anything.
+
+        With ``config.workers`` above 1 the frames are drawn on worker
+        processes instead (see ``_render_frames_parallel``).
+
+        Every frame is mapped onto one palette fitted to the first and last
+        frames, which between them show every color in use; left to
+        itself, Pillow fits a palette to each frame separately.
+        """
+        workers = self.ea.config.workers
+        if workers > 1:
+            frames = self._render_frames_parallel(workers)
+        else:
+            frames = [self._grab_frame()]
+            while not self._should_stop():
+                self._animate(len(frames))
+                frames.append(self._grab_frame())
+
+        palette = _fit_palette([frames[0], frames[-1]])
+        frames = [
+            frame.quantize(palette=palette, dither=Image.Dither.NONE)
+            for frame in frames
+        ]
+
+        # 20 fps, looping forever
+        frames[0].save(
+            self.save_path,
+            save_all=True,
+            append_images=frames[1:],
+            duration=50,
+            loop=0,
+        )
+
+    def _render_frames_parallel(self, workers: int) -> List[Image.Image]:
+        """Evolve here while worker processes draw the frames.
+
+        Each frame is recorded as a _Frame and submitted as soon as its
+        generations are done, so drawing overlaps with evolving. The
+        images come back in order and match the ones drawn in-process.
+
+        Args:
+            workers: Number of drawing processes.
+
+        Returns:
+            Rendered frames, first to last.
+        """
+        # Imported here: the multiprocessing machinery is only needed for
+        # parallel saves and is slow to import
+        from concurrent.futures import ProcessPoolExecutor
+
+        frame = _Frame(self.ea)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_frame_worker,
+            initargs=(frame,),
+        ) as pool:
+            futures = [pool.submit(_render_frame, frame)]
+            while not self._should_stop():
+                # A run that stops mid-batch repeats the last frame, as the
+                # in-process loop does
+                if self._advance():
+                    frame = _Frame(self.ea)
+                futures.append(pool.submit(_render_frame, frame))
+            return [future.result() for future in futures]
 
     def run(self) -> Individual:
         """Run the visualization.
@@ -613,38 +960,29 @@ class ShapePackerVisualizer:
         """
         self.ea.initialize()
         self._start_time = time.time()
-        self._draw_board(self.ea.best)
-        self._update_fitness_plot()
-        self._update_diversity_plot()
-        self._update_improvement_plot()
+        self._draw_frame()
 
         if self.save_path:
-            # Use generator for time-based stopping
             print(f"Saving animation to {self.save_path}...")
             if self.duration_seconds:
                 print(f"Recording for {self.duration_seconds} seconds...")
 
-            anim = FuncAnimation(
-                self.fig,
-                self._animate,
-                frames=self._frame_generator,
-                interval=50,
-                repeat=False,
-                cache_frame_data=False,
-            )
-
-            writer = PillowWriter(fps=20)
-            anim.save(str(self.save_path), writer=writer, dpi=100)
+            self._save_gif()
             final_gen = self.ea.generation
             print(f"Saved {final_gen} generations to {self.save_path}")
         else:
             # Live mode - calculate frames needed
             frames = self.max_generations // self.update_interval + 1
+            if self.max_fps:
+                # _animate paces the frames itself, so the timer only has
+                # to hand control back as soon as a redraw is done
+                self._frame_period = 1 / self.max_fps
+                self._last_draw = time.perf_counter()
             anim = FuncAnimation(
                 self.fig,
                 self._animate,
                 frames=frames,
-                interval=50,
+                interval=1 if self.max_fps else 50,
                 repeat=False,
             )
             plt.show()
@@ -652,6 +990,32 @@ class ShapePackerVisualizer:
         return self.ea.best
 
 
+# Visualizer that draws recorded frames in a GIF worker process. It is
+# built once per process by the pool initializer.
+_frame_visualizer: Optional[ShapePackerVisualizer] = None
+
+
+def _init_frame_worker(first: _Frame) -> None:
+    """Build the figure that a worker process draws frames on."""
+    global _frame_visualizer
+    plt.switch_backend("Agg")
+    _frame_visualizer = ShapePackerVisualizer(first)
+
+
+def _render_frame(frame: _Frame) -> Image.Image:
+    """Draw a recorded frame in a worker process.
+
+    Args:
+        frame: State to show.
+
+    Returns:
+        The rendered frame as an RGB image.
+    """
+    _frame_visualizer.ea = frame
+    _frame_visualizer._draw_frame()
+    return _frame_visualizer._grab_frame()
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -708,6 +1072,19 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Save animation as GIF to this path (e.g., --save=run.gif)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to draw GIF frames (with --save)",
+    )
+    parser.add_argument(
+        "--max-fps",
+        type=float,
+        default=20,
+        help="Live display: redraw at most this many times per second, "
+        "evolving in between (0 to draw every interval)",
+    )
 
     return parser.parse_args(argv)
 
@@ -731,6 +1108,7 @@ def main(argv: list[str] | None = None) -> int:
         lambda_=args.lambda_,
         mutation_rate=args.mutation_rate,
         seed=args.seed,
+        workers=args.workers,
     )
 
     print(f"\nStarting visualization...")
@@ -745,6 +1123,7 @@ def main(argv: list[str] | None = None) -> int:
         update_interval=args.interval,
         max_generations=args.max_generations,
         save_path=args.save,
+        max_fps=args.max_fps or None,
     )
 
     start_time = time.time()